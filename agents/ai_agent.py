@@ -9,6 +9,7 @@ Provides:
 - Natural-language research + recommendation generation
 """
 
+import asyncio
 import logging
 import math
 import statistics
@@ -16,6 +17,8 @@ from collections import deque
 from datetime import datetime, timezone
 from typing import Any, Deque, Dict, List, Optional
 
+import aiohttp
+
 from orchestrator.agent import AgentBase
 from orchestrator.device import ESP32Device
 
@@ -48,6 +51,18 @@ class AIAgent(AgentBase):
         self._rssi_windows: Dict[str, Deque[float]] = {}
         # Per-device recommendation cache
         self._recommendations: Dict[str, Dict[str, Any]] = {}
+        # aiohttp session for the research endpoint, created on first use
+        self._session: Optional[Any] = None
+        self._session_lock = asyncio.Lock()
+
+    async def _on_stop(self) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the research endpoint HTTP session, if one was opened."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     # ------------------------------------------------------------------
     # AgentBase interface
@@ -280,15 +295,15 @@ class AIAgent(AgentBase):
 
         if endpoint:
             try:
-                import json
-                import urllib.request
-
-                body = json.dumps({"query": query, "context": params.get("context", {})}).encode()
-                req = urllib.request.Request(
-                    endpoint, data=body, headers={"Content-Type": "application/json"}
-                )
-                with urllib.request.urlopen(req, timeout=30) as resp:
-                    return json.loads(resp.read())
+                session = await self._get_session()
+                timeout = aiohttp.ClientTimeout(total=self.config.get("ai_research_timeout", 30))
+                async with session.post(
+                    endpoint,
+                    json={"query": query, "context": params.get("context", {})},
+                    timeout=timeout,
+                    raise_for_status=True,
+                ) as resp:
+                    return await resp.json(content_type=None)
             except Exception as exc:  # pylint: disable=broad-except
                 logger.warning("AI research endpoint failed: %s — using heuristics", exc)
 
@@ -304,6 +319,13 @@ class AIAgent(AgentBase):
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
 
+    async def _get_session(self) -> Any:
+        """Return the shared research session, creating it on first use."""
+        async with self._session_lock:
+            if self._session is None or self._session.closed:
+                self._session = aiohttp.ClientSession()
+            return self._session
+
     async def _auto_tune_fleet(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Run auto-optimise across all online devices simultaneously.
@@ -311,7 +333,6 @@ class AIAgent(AgentBase):
         if not self.orchestrator:
             return {"tuned": 0}
         devices = self.orchestrator.get_online_devices()
-        import asyncio
         results = await asyncio.gather(
             *[self._auto_optimise(params, d) for d in devices],
             return_exceptions=True,
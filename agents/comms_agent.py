@@ -4,7 +4,7 @@ GPS/GNSS parsing, and cloud telemetry upload for the ESP32 fleet.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from orchestrator.agent import AgentBase
 from orchestrator.device import ESP32Device, DeviceCapability
@@ -37,6 +37,13 @@ class CommsAgent(AgentBase):
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__("comms_agent", config)
+        # Cloud connectors keyed by (type, endpoint) so HTTP sessions are reused
+        self._connectors: Dict[Tuple[str, str], Any] = {}
+
+    async def _on_stop(self) -> None:
+        for connector in self._connectors.values():
+            await connector.aclose()
+        self._connectors.clear()
 
     async def _execute(
         self,
@@ -176,7 +183,11 @@ class CommsAgent(AgentBase):
         endpoint = params.get("endpoint", self.config.get("cloud_endpoint", ""))
         payload = device.to_dict() if device else params.get("payload", {})
 
-        connector = CloudConnector.create(connector_type, endpoint, self.config)
+        key = (connector_type.lower(), endpoint)
+        connector = self._connectors.get(key)
+        if connector is None:
+            connector = CloudConnector.create(connector_type, endpoint, self.config)
+            self._connectors[key] = connector
         ok = await connector.push(payload)
         logger.info("Cloud push (%s) for %s: %s",
                     connector_type,
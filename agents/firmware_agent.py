@@ -7,12 +7,13 @@ import hashlib
 import logging
 import os
 import shutil
-import subprocess
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from firmware.builder import compile_sketch, read_template
+from firmware.flasher import OTAFlasher
 from orchestrator.agent import AgentBase
 from orchestrator.device import ESP32Device
 
@@ -38,8 +39,22 @@ class FirmwareAgent(AgentBase):
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__("firmware_agent", config)
         self._build_cache: Dict[str, Dict[str, Any]] = {}  # build_id → metadata
+        self._flasher: Optional[OTAFlasher] = None  # serves local builds, started on demand
         FIRMWARE_BUILD_DIR.mkdir(parents=True, exist_ok=True)
 
+    async def _on_stop(self) -> None:
+        if self._flasher is not None:
+            await self._flasher.close()
+            self._flasher = None
+
+    def _get_flasher(self) -> OTAFlasher:
+        if self._flasher is None:
+            self._flasher = OTAFlasher(
+                host_ip=self.config.get("ota_host"),
+                port=int(self.config.get("ota_port", 8888)),
+            )
+        return self._flasher
+
     # ------------------------------------------------------------------
     # AgentBase interface
     # ------------------------------------------------------------------
@@ -90,7 +105,7 @@ class FirmwareAgent(AgentBase):
 
         # Load and merge template sources
         sources = self._assemble_sources(template_name, features, version, extra)
-        build_id = hashlib.sha256(sources.encode()).hexdigest()[:12]
+        build_id = hashlib.blake2b(sources.encode(), digest_size=6).hexdigest()
 
         build_dir = FIRMWARE_BUILD_DIR / build_id
         if build_dir.exists():
@@ -155,8 +170,9 @@ class FirmwareAgent(AgentBase):
             meta = self._build_cache.get(build_id)
             if not meta:
                 return {"ok": False, "reason": f"build {build_id} not found"}
-            # In production this URL would point to a hosted artifact
-            firmware_url = firmware_url or f"/builds/{build_id}/firmware.bin"
+            if not firmware_url:
+                # Serve the local binary from the OTA HTTP server
+                return await self._get_flasher().flash_device(device, meta["binary_path"])
 
         if not firmware_url:
             return {"ok": False, "reason": "no firmware_url or build_id supplied"}
@@ -207,17 +223,17 @@ class FirmwareAgent(AgentBase):
             lines.append(f"#define {key.upper()} {val}")
         lines.append("")
 
-        base_path = FIRMWARE_TEMPLATE_DIR / f"{template}.cpp"
-        if base_path.exists():
-            lines.append(base_path.read_text(encoding="utf-8"))
+        base_source = read_template(template, FIRMWARE_TEMPLATE_DIR)
+        if base_source is not None:
+            lines.append(base_source)
         else:
             lines.append(self._default_base_source(version))
 
         for feature in features:
-            feat_path = FIRMWARE_TEMPLATE_DIR / f"{feature}.cpp"
-            if feat_path.exists():
+            feat_source = read_template(feature, FIRMWARE_TEMPLATE_DIR)
+            if feat_source is not None:
                 lines.append(f"// --- Feature: {feature} ---")
-                lines.append(feat_path.read_text(encoding="utf-8"))
+                lines.append(feat_source)
 
         return "\n".join(lines)
 
@@ -248,21 +264,7 @@ void loop() {{
     ) -> bool:
         """Invoke arduino-cli to compile source for esp32."""
         try:
-            cmd = [
-                "arduino-cli", "compile",
-                "--fqbn", "esp32:esp32:esp32",
-                "--output-dir", str(build_dir),
-                str(source_file),
-            ]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
-            if result.returncode == 0:
-                # arduino-cli places the .bin in the build dir
-                bins = list(build_dir.glob("*.bin"))
-                if bins:
-                    shutil.copy(bins[0], output)
-                return True
-            logger.error("arduino-cli error: %s", result.stderr)
-            return False
+            return await compile_sketch(source_file, build_dir, output, timeout=120)
         except Exception as exc:  # pylint: disable=broad-except
             logger.error("arduino-cli invocation failed: %s", exc)
             return False
@@ -4,7 +4,8 @@ and real-time adaptive control for ESP32 radio modules.
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from orchestrator.agent import AgentBase
 from orchestrator.device import ESP32Device
@@ -20,6 +21,8 @@ ISM_BANDS: Dict[str, Tuple[float, float]] = {
     "433MHz": (433.05e6, 434.79e6),
 }
 
+LOCK_HISTORY_SIZE = 100  # lock targets remembered per device
+
 
 class FrequencyAgent(AgentBase):
     """
@@ -44,7 +47,7 @@ class FrequencyAgent(AgentBase):
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__("frequency_agent", config)
-        self._lock_history: Dict[str, List[float]] = {}   # device_id → history
+        self._lock_history: Dict[str, Deque[float]] = {}   # device_id → history
         self._target_frequencies: Dict[str, float] = {}
 
     # ------------------------------------------------------------------
@@ -113,10 +116,10 @@ class FrequencyAgent(AgentBase):
             await device.set_frequency(target)
             current_rssi = await device.get_rssi()
             self._target_frequencies[device.device_id] = target
-            history = self._lock_history.setdefault(device.device_id, [])
+            history = self._lock_history.setdefault(
+                device.device_id, deque(maxlen=LOCK_HISTORY_SIZE)
+            )
             history.append(target)
-            if len(history) > 100:
-                history.pop(0)
             logger.info("Locked device %s to %.3f MHz (RSSI=%s)",
                         device.device_id, target / 1e6, current_rssi)
             return {
@@ -185,7 +188,7 @@ class FrequencyAgent(AgentBase):
             # Default 2.4 GHz WiFi channels (centre freqs in Hz)
             sequence = [2412e6, 2437e6, 2462e6]
         next_freq = sequence[0]
-        history = self._lock_history.get(device.device_id, [])
+        history = self._lock_history.get(device.device_id)
         if history:
             last = history[-1]
             for i, f in enumerate(sequence):
@@ -9,9 +9,11 @@ Orchestrates AI agents to perform autonomous operations across the fleet:
 """
 
 import asyncio
+import copy
 import logging
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -54,9 +56,12 @@ class AutomationEngine:
     def __init__(self, orchestrator: Any, config: Optional[Dict[str, Any]] = None):
         self.orchestrator = orchestrator
         self.config = config or {}
-        self._policies: List[AutomationPolicy] = list(self.DEFAULT_POLICIES)
+        # Copies, so run counts and enable flags are per engine
+        self._policies: List[AutomationPolicy] = copy.deepcopy(self.DEFAULT_POLICIES)
         self._running = False
         self._callbacks: Dict[str, List[Callable]] = {}
+        # Read-only policy snapshot, rebuilt only after a policy changes
+        self._list_cache: Optional[Tuple[Mapping[str, Any], ...]] = None
 
     # ------------------------------------------------------------------
     # Policy management
@@ -64,30 +69,44 @@ class AutomationEngine:
 
     def add_policy(self, policy: AutomationPolicy) -> None:
         self._policies.append(policy)
+        self._list_cache = None
 
     def remove_policy(self, name: str) -> bool:
         before = len(self._policies)
         self._policies = [p for p in self._policies if p.name != name]
+        self._list_cache = None
         return len(self._policies) < before
 
     def enable_policy(self, name: str, enabled: bool = True) -> None:
         for p in self._policies:
             if p.name == name:
                 p.enabled = enabled
+                self._list_cache = None
                 return
 
-    def list_policies(self) -> List[Dict[str, Any]]:
-        return [
-            {
+    def list_policies(self) -> Tuple[Mapping[str, Any], ...]:
+        """
+        Return a read-only snapshot of all policies.
+
+        The snapshot is shared between callers and cached until a policy
+        changes; copy an entry with ``dict()`` to modify it.
+        """
+        if self._list_cache is None:
+            self._list_cache = self._build_policy_list()
+        return self._list_cache
+
+    def _build_policy_list(self) -> Tuple[Mapping[str, Any], ...]:
+        return tuple(
+            MappingProxyType({
                 "name": p.name,
                 "action": p.action,
                 "interval_sec": p.interval_sec,
                 "enabled": p.enabled,
                 "last_run": p.last_run,
                 "run_count": p.run_count,
-            }
+            })
             for p in self._policies
-        ]
+        )
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -137,6 +156,7 @@ class AutomationEngine:
             )
             policy.last_run = datetime.now(timezone.utc).isoformat()
             policy.run_count += 1
+            self._list_cache = None
             logger.debug("Policy '%s' fired → task %s", policy.name, task_id)
         except Exception as exc:  # pylint: disable=broad-except
             logger.warning("Policy '%s' execution failed: %s", policy.name, exc)
@@ -70,10 +70,29 @@ class FrequencyLockController:
         kd: float = 500.0,
         max_correction_hz: float = 1e6,
     ):
-        self.target_rssi = target_rssi
+        self._target_rssi = target_rssi
         self.max_correction_hz = max_correction_hz
         self._pid = PIDController(kp, ki, kd)
 
+    @property
+    def target_rssi(self) -> float:
+        return self._target_rssi
+
+    @target_rssi.setter
+    def target_rssi(self, value: float) -> None:
+        self.set_target(value)
+
+    def set_target(self, target: float) -> None:
+        """
+        Change the RSSI setpoint.
+
+        The PID state is reset when the setpoint actually changes so the
+        integral accumulated against the old target does not overshoot.
+        """
+        if target != self._target_rssi:
+            self._pid.reset()
+        self._target_rssi = target
+
     def reset(self) -> None:
         self._pid.reset()
 
@@ -11,10 +11,108 @@ Provides endpoints for:
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# TTLs (seconds) for the shared response cache on polled read endpoints
+CACHE_TTL: Dict[str, int] = {"status": 2, "devices": 2, "agents": 5}
+_CACHE_PREFIX = "api:v1:"
+
+# TTLs (seconds) for the per-process memo checked before Redis
+MEMO_TTL: Dict[str, float] = {"status": 1.0}
+
+
+def _memo(request: Any) -> Dict[str, Tuple[float, Any]]:
+    """Per-app ``{key: (expires_at, payload)}`` memo, created on first use."""
+    memo = getattr(request.app.state, "memo", None)
+    if memo is None:
+        memo = request.app.state.memo = {}
+    return memo
+
+
+async def _cached(request: Any, key: str, build: Callable[[], Any]) -> Any:
+    """
+    Serve a read endpoint through the Redis response cache.
+
+    Keys listed in ``MEMO_TTL`` are first looked up in a per-process memo so
+    tight polling from one worker never leaves the process.  On a Redis hit
+    the stored JSON bytes are returned as-is; on a miss ``build()`` is called
+    and its result stored for ``CACHE_TTL[key]`` seconds.  Falls back to
+    calling ``build()`` directly when no Redis client is configured or Redis
+    is unreachable.
+    """
+    ttl = MEMO_TTL.get(key)
+    if ttl is None:
+        return await _cached_shared(request, key, build)
+
+    memo = _memo(request)
+    now = time.monotonic()
+    entry = memo.get(key)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+    payload = await _cached_shared(request, key, build)
+    memo[key] = (now + ttl, payload)
+    return payload
+
+
+async def _cached_shared(request: Any, key: str, build: Callable[[], Any]) -> Any:
+    """Redis layer of :func:`_cached`."""
+    redis = getattr(request.app.state, "redis", None)
+    if redis is None:
+        return build()
+
+    from fastapi import Response
+    from redis.exceptions import RedisError
+
+    cache_key = _CACHE_PREFIX + key
+    try:
+        cached = await redis.get(cache_key)
+    except RedisError as exc:
+        logger.debug("Response cache read failed (%s): %s", key, exc)
+        return build()
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    payload = build()
+    try:
+        await redis.set(cache_key, orjson.dumps(payload), ex=CACHE_TTL[key])
+    except (RedisError, TypeError) as exc:
+        logger.debug("Response cache write failed (%s): %s", key, exc)
+    return payload
+
+
+async def _invalidate(request: Any, *keys: str) -> None:
+    """Drop cached responses after a mutating request."""
+    memo = _memo(request)
+    for k in keys:
+        memo.pop(k, None)
+
+    redis = getattr(request.app.state, "redis", None)
+    if redis is None:
+        return
+
+    from redis.exceptions import RedisError
+
+    try:
+        await redis.delete(*(_CACHE_PREFIX + k for k in keys))
+    except RedisError as exc:
+        logger.debug("Response cache invalidation failed: %s", exc)
+
+
+@lru_cache(maxsize=128)
+def _parse_capability(name: str) -> Optional[Any]:
+    """Map a capability name to a DeviceCapability, or None if unknown."""
+    from orchestrator.device import DeviceCapability
+    try:
+        return DeviceCapability(name)
+    except ValueError:
+        return None
+
 
 def build_router():
     try:
@@ -59,7 +157,7 @@ def build_router():
 
     @router.get("/status", tags=["System"])
     async def get_status(request: Request):
-        return request.app.state.orchestrator.get_status()
+        return await _cached(request, "status", request.app.state.orchestrator.get_status)
 
     # ------------------------------------------------------------------
     # Devices
@@ -67,7 +165,10 @@ def build_router():
 
     @router.get("/devices", tags=["Devices"])
     async def list_devices(request: Request):
-        return [d.to_dict() for d in request.app.state.orchestrator.list_devices()]
+        orchestrator = request.app.state.orchestrator
+        return await _cached(
+            request, "devices", lambda: [d.to_dict() for d in orchestrator.devices_view()]
+        )
 
     @router.get("/devices/{device_id}", tags=["Devices"])
     async def get_device(device_id: str, request: Request):
@@ -78,13 +179,8 @@ def build_router():
 
     @router.post("/devices", tags=["Devices"])
     async def register_device(body: DeviceCreate, request: Request):
-        from orchestrator.device import ESP32Device, DeviceCapability
-        caps = []
-        for c in (body.capabilities or []):
-            try:
-                caps.append(DeviceCapability(c))
-            except ValueError:
-                pass
+        from orchestrator.device import ESP32Device
+        caps = [c for c in map(_parse_capability, body.capabilities or []) if c is not None]
         device = ESP32Device(
             device_id=body.device_id,
             name=body.name,
@@ -93,6 +189,7 @@ def build_router():
             capabilities=caps or None,
         )
         device_id = request.app.state.orchestrator.register_device(device)
+        await _invalidate(request, "status", "devices")
         return {"device_id": device_id}
 
     @router.delete("/devices/{device_id}", tags=["Devices"])
@@ -100,6 +197,7 @@ def build_router():
         ok = request.app.state.orchestrator.unregister_device(device_id)
         if not ok:
             raise HTTPException(status_code=404, detail="Device not found")
+        await _invalidate(request, "status", "devices")
         return {"ok": True}
 
     @router.post("/devices/{device_id}/ping", tags=["Devices"])
@@ -116,7 +214,10 @@ def build_router():
 
     @router.get("/agents", tags=["Agents"])
     async def list_agents(request: Request):
-        return [a.get_metrics() for a in request.app.state.orchestrator.list_agents()]
+        orchestrator = request.app.state.orchestrator
+        return await _cached(
+            request, "agents", lambda: [a.get_metrics() for a in orchestrator.list_agents()]
+        )
 
     @router.get("/agents/{agent_id}", tags=["Agents"])
     async def get_agent(agent_id: str, request: Request):
@@ -135,15 +236,17 @@ def build_router():
             task_id = await request.app.state.orchestrator.dispatch_task(
                 body.agent_id, body.task, body.params, body.device_id
             )
-            return {"task_id": task_id}
         except ValueError as exc:
             raise HTTPException(status_code=400, detail=str(exc))
+        await _invalidate(request, "status", "devices", "agents")
+        return {"task_id": task_id}
 
     @router.post("/tasks/broadcast", tags=["Tasks"])
     async def broadcast_task(body: BroadcastRequest, request: Request):
         task_ids = await request.app.state.orchestrator.broadcast_task(
             body.agent_type, body.task, body.params
         )
+        await _invalidate(request, "status", "devices", "agents")
         return {"task_ids": task_ids}
 
     @router.get("/tasks/{task_id}", tags=["Tasks"])
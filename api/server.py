@@ -21,14 +21,16 @@ def create_app(orchestrator=None):
     try:
         from fastapi import FastAPI
         from fastapi.middleware.cors import CORSMiddleware
+        from fastapi.middleware.gzip import GZipMiddleware
     except ImportError:
         raise RuntimeError(
             "FastAPI is required to run the API server. "
             "Install it with: pip install fastapi uvicorn"
         )
 
+    from .responses import ORJSONResponse
     from .routes import build_router
-    from .websocket import build_ws_router
+    from .websocket import build_ws_router, status_ticker
 
     app = FastAPI(
         title="Multi-Agent ESP32 Orchestration API",
@@ -38,6 +40,7 @@ def create_app(orchestrator=None):
             "firmware OTA deployment, GPS/GNSS tracking, and cloud integration."
         ),
         version="1.0.0",
+        default_response_class=ORJSONResponse,
     )
 
     # Allow cross-origin requests (mobile apps, web dashboards)
@@ -48,12 +51,18 @@ def create_app(orchestrator=None):
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    # Compress larger JSON bodies (device / agent lists, task results)
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
     # Attach the orchestrator to app state
     if orchestrator is None:
         from orchestrator import Orchestrator
         orchestrator = Orchestrator()
     app.state.orchestrator = orchestrator
+    app.state.redis = None
+    app.state.memo = {}
+    app.state.latest_status = None
+    app.state.status_task = None
 
     # Register startup / shutdown hooks
     @app.on_event("startup")
@@ -61,10 +70,27 @@ def create_app(orchestrator=None):
         import asyncio
         asyncio.ensure_future(orchestrator.start())
         logger.info("Orchestrator started via API startup hook")
+        app.state.status_task = asyncio.ensure_future(status_ticker(app))
+
+        redis_url = orchestrator.config.get("server", {}).get("redis_url")
+        if redis_url:
+            try:
+                import redis.asyncio as aioredis
+                app.state.redis = aioredis.from_url(redis_url)
+                logger.info("API response cache enabled (%s)", redis_url)
+            except ImportError:
+                logger.warning("redis not installed — API response cache disabled. "
+                               "Install with: pip install redis")
 
     @app.on_event("shutdown")
     async def _shutdown():
+        if app.state.status_task is not None:
+            app.state.status_task.cancel()
+            app.state.status_task = None
         await orchestrator.stop()
+        if app.state.redis is not None:
+            await app.state.redis.aclose()
+            app.state.redis = None
         logger.info("Orchestrator stopped via API shutdown hook")
 
     # Mount routers
@@ -4,14 +4,150 @@ to connected clients (mobile apps, web dashboards).
 """
 
 import asyncio
-import json
 import logging
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Tuple, Union
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
-# Global set of active WebSocket connections
-_connections: Set[Any] = set()
+Frame = Union[str, bytes]
+
+# Per-client outbound queue depth; the oldest message is dropped when full
+CLIENT_QUEUE_SIZE = 32
+
+# Wire formats a client can request with ``?format=``
+FORMATS = ("json", "msgpack")
+
+
+class _Client:
+    """Outbound queue and negotiated wire format for one connection."""
+
+    __slots__ = ("queue", "fmt")
+
+    def __init__(self, fmt: str = "json"):
+        self.queue: "asyncio.Queue[Tuple[str, Frame]]" = asyncio.Queue(
+            maxsize=CLIENT_QUEUE_SIZE
+        )
+        self.fmt = fmt
+
+    def offer(self, kind: str, frame: Frame) -> None:
+        """Enqueue without blocking, evicting the oldest message for slow clients."""
+        if self.queue.full():
+            try:
+                self.queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+        self.queue.put_nowait((kind, frame))
+
+
+# Active WebSocket connections
+_connections: Dict[Any, _Client] = {}
+
+
+def _dumps(obj: Any) -> str:
+    """
+    Serialise a message with orjson.
+
+    JSON frames stay text (not binary) because clients ``JSON.parse`` the
+    frame data directly.
+    """
+    return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _encode(obj: Any, fmt: str) -> Frame:
+    """Encode a message for the given wire format (msgpack → binary frame)."""
+    if fmt == "msgpack":
+        import msgpack  # type: ignore
+        return msgpack.packb(obj, use_bin_type=True, default=str)
+    return _dumps(obj)
+
+
+def _negotiate_format(requested: str) -> str:
+    if requested not in FORMATS:
+        return "json"
+    if requested == "msgpack":
+        try:
+            import msgpack  # type: ignore  # noqa: F401
+        except ImportError:
+            logger.warning("msgpack not installed — falling back to JSON frames. "
+                           "Install with: pip install msgpack")
+            return "json"
+    return requested
+
+
+async def _relay(websocket: Any, client: _Client) -> None:
+    """
+    Drain one client's queue onto its socket.
+
+    Whatever has piled up since the last send is flushed in order, except
+    that only the newest ``status`` frame is kept.
+    """
+    queue = client.queue
+    while True:
+        batch = [await queue.get()]
+        while not queue.empty():
+            batch.append(queue.get_nowait())
+        last_status = max(
+            (i for i, (kind, _) in enumerate(batch) if kind == "status"), default=-1
+        )
+        try:
+            for i, (kind, frame) in enumerate(batch):
+                if kind == "status" and i != last_status:
+                    continue
+                if isinstance(frame, bytes):
+                    await websocket.send_bytes(frame)
+                else:
+                    await websocket.send_text(frame)
+        except Exception:  # pylint: disable=broad-except
+            _connections.pop(websocket, None)
+            return
+
+
+def _status_payload(orchestrator: Any, fmt: str = "json") -> Frame:
+    """Serialise the orchestrator status + device list frame."""
+    if fmt != "json":
+        return _encode({
+            "type": "status",
+            "orchestrator": orchestrator.get_status(),
+            "devices": [d.to_dict() for d in orchestrator.devices_view()],
+        }, fmt)
+    # Splice the pre-encoded device array in rather than re-encoding dicts
+    return (
+        b'{"type":"status","orchestrator":'
+        + orjson.dumps(orchestrator.get_status(), default=str,
+                       option=orjson.OPT_NON_STR_KEYS)
+        + b',"devices":'
+        + orchestrator.devices_json()
+        + b"}"
+    ).decode()
+
+
+async def status_ticker(app: Any, interval: float = 1.0) -> None:
+    """
+    Build the status frame once per tick and queue it for every client.
+
+    The latest JSON frame is kept on ``app.state.latest_status`` so new
+    connections can be sent it immediately.  Ticks with no clients do no
+    work and clear it, so the next connection builds a fresh frame.
+    """
+    orchestrator = app.state.orchestrator
+    while True:
+        if not _connections:
+            app.state.latest_status = None
+            await asyncio.sleep(interval)
+            continue
+        try:
+            frames: Dict[str, Frame] = {"json": _status_payload(orchestrator)}
+            app.state.latest_status = frames["json"]
+            for client in list(_connections.values()):
+                frame = frames.get(client.fmt)
+                if frame is None:
+                    frame = frames[client.fmt] = _status_payload(orchestrator, client.fmt)
+                client.offer("status", frame)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.error("Status ticker error: %s", exc)
+        await asyncio.sleep(interval)
 
 
 def build_ws_router():
@@ -26,55 +162,49 @@ def build_ws_router():
     async def telemetry_ws(websocket: WebSocket):
         """
         WebSocket endpoint that pushes orchestrator status and device
-        telemetry to connected clients at 1 Hz.
+        telemetry to connected clients at 1 Hz (see :func:`status_ticker`).
+
+        Frames are JSON text by default; connect with ``?format=msgpack``
+        to receive msgpack binary frames instead.
 
         Clients can also send JSON commands:
           {"command": "dispatch", "agent_id": "...", "task": "...", "params": {...}}
         """
         await websocket.accept()
-        _connections.add(websocket)
+        client = _Client(_negotiate_format(websocket.query_params.get("format", "json")))
+        _connections[websocket] = client
+        relay_task = asyncio.ensure_future(_relay(websocket, client))
         orchestrator = websocket.app.state.orchestrator
-        logger.info("WebSocket client connected")
+        logger.info("WebSocket client connected (%s)", client.fmt)
 
-        try:
-            async def _push_loop():
-                while True:
-                    try:
-                        status = orchestrator.get_status()
-                        devices = [d.to_dict() for d in orchestrator.list_devices()]
-                        payload = json.dumps({
-                            "type": "status",
-                            "orchestrator": status,
-                            "devices": devices,
-                        })
-                        await websocket.send_text(payload)
-                    except Exception:  # pylint: disable=broad-except
-                        break
-                    await asyncio.sleep(1)
-
-            push_task = asyncio.ensure_future(_push_loop())
+        # Don't make a new client wait up to a second for its first frame
+        latest = getattr(websocket.app.state, "latest_status", None)
+        if latest is None or client.fmt != "json":
+            latest = _status_payload(orchestrator, client.fmt)
+        client.offer("status", latest)
 
+        try:
             # Receive loop
             while True:
                 raw = await websocket.receive_text()
                 try:
-                    msg = json.loads(raw)
-                    await _handle_ws_message(orchestrator, websocket, msg)
-                except json.JSONDecodeError:
-                    await websocket.send_text(
-                        json.dumps({"type": "error", "detail": "Invalid JSON"})
-                    )
+                    msg = orjson.loads(raw)
+                    await _handle_ws_message(orchestrator, client, msg)
+                except orjson.JSONDecodeError:
+                    client.offer("reply", _encode(
+                        {"type": "error", "detail": "Invalid JSON"}, client.fmt
+                    ))
         except WebSocketDisconnect:
             logger.info("WebSocket client disconnected")
         finally:
-            _connections.discard(websocket)
-            push_task.cancel()
+            _connections.pop(websocket, None)
+            relay_task.cancel()
 
     return router
 
 
 async def _handle_ws_message(
-    orchestrator: Any, websocket: Any, msg: Dict[str, Any]
+    orchestrator: Any, client: _Client, msg: Dict[str, Any]
 ) -> None:
     """Process an inbound WebSocket message from a client."""
     command = msg.get("command")
@@ -86,28 +216,23 @@ async def _handle_ws_message(
                 msg.get("params", {}),
                 msg.get("device_id"),
             )
-            await websocket.send_text(
-                json.dumps({"type": "task_queued", "task_id": task_id})
-            )
+            reply = {"type": "task_queued", "task_id": task_id}
         except (KeyError, ValueError) as exc:
-            await websocket.send_text(
-                json.dumps({"type": "error", "detail": str(exc)})
-            )
+            reply = {"type": "error", "detail": str(exc)}
     elif command == "ping":
-        await websocket.send_text(json.dumps({"type": "pong"}))
+        reply = {"type": "pong"}
     else:
-        await websocket.send_text(
-            json.dumps({"type": "error", "detail": f"Unknown command: {command}"})
-        )
+        reply = {"type": "error", "detail": f"Unknown command: {command}"}
+    client.offer("reply", _encode(reply, client.fmt))
 
 
 async def broadcast_event(event: Dict[str, Any]) -> None:
-    """Broadcast an event to all connected WebSocket clients."""
-    payload = json.dumps(event)
-    dead = set()
-    for ws in _connections:
-        try:
-            await ws.send_text(payload)
-        except Exception:  # pylint: disable=broad-except
-            dead.add(ws)
-    _connections.difference_update(dead)
+    """Queue an event for every connected WebSocket client."""
+    if not _connections:
+        return
+    frames: Dict[str, Frame] = {}
+    for client in list(_connections.values()):
+        frame = frames.get(client.fmt)
+        if frame is None:
+            frame = frames[client.fmt] = _encode(event, client.fmt)
+        client.offer("event", frame)
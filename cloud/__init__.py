@@ -2,7 +2,14 @@
 Cloud integration package
 """
 
-from .connector import CloudConnector, HTTPConnector, AWSConnector, GCPConnector, AzureConnector
+from .connector import (
+    CloudConnector,
+    HTTPConnector,
+    AWSConnector,
+    GCPConnector,
+    AzureConnector,
+    BufferedCloudConnector,
+)
 
 __all__ = [
     "CloudConnector",
@@ -10,4 +17,5 @@ __all__ = [
     "AWSConnector",
     "GCPConnector",
     "AzureConnector",
+    "BufferedCloudConnector",
 ]
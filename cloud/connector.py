@@ -8,12 +8,15 @@ Supported connectors:
   - azure   : Azure IoT Hub
 """
 
-import json
+import asyncio
+import gzip
 import logging
-import urllib.request
-import urllib.error
+import sqlite3
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +36,9 @@ class CloudConnector(ABC):
     async def pull(self, topic: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Pull a message / command from the cloud backend."""
 
+    async def aclose(self) -> None:
+        """Release any network resources held by the connector."""
+
     @classmethod
     def create(
         cls,
@@ -52,28 +58,114 @@ class CloudConnector(ABC):
         if klass is None:
             raise ValueError(f"Unknown connector type: {connector_type}. "
                              f"Choose from {list(connectors)}")
+        outbox_path = config.get("cloud_outbox_path")
+        if outbox_path:
+            # The outbox deletes a row as soon as push() returns True, so the
+            # wrapped connector must not report buffered payloads as sent.
+            return BufferedCloudConnector(
+                klass(endpoint, {**config, "cloud_batch_size": 1}),
+                outbox_path,
+                max_rows=int(config.get("cloud_outbox_max_rows", 10_000)),
+                target=f"{connector_type.lower()}:{endpoint}",
+            )
         return klass(endpoint, config)
 
 
 class HTTPConnector(CloudConnector):
-    """Generic HTTP POST connector."""
+    """
+    Generic HTTP POST connector.
+
+    Requests share one keep-alive aiohttp session, opened on first use and
+    released by :meth:`aclose`.
+
+    Setting ``cloud_batch_size`` above 1 enables batching: payloads are
+    buffered and POSTed together as a JSON array once the batch is full or
+    ``cloud_batch_interval`` seconds have passed.  Batches over 1 KiB are
+    sent gzip-encoded.  A batch whose POST fails goes back to the front of
+    the buffer, which holds at most ``cloud_buffer_max`` payloads (oldest
+    dropped first).  Batching is disabled when ``cloud_outbox_path`` is set,
+    since the outbox already queues and retries.
+    """
+
+    GZIP_MIN_BYTES = 1024
+
+    def __init__(self, endpoint: str, config: Dict[str, Any]):
+        super().__init__(endpoint, config)
+        self._session: Optional[Any] = None
+        self._batch_size = int(config.get("cloud_batch_size", 1))
+        self._batch_interval = float(config.get("cloud_batch_interval", 0.5))
+        self._buffer_max = int(config.get("cloud_buffer_max", 10_000))
+        self._buffer: List[Dict[str, Any]] = []
+        self._flush_task: Optional[asyncio.Future] = None
+
+    def _get_session(self) -> Any:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=16, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=10),
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        await self.flush()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     async def push(self, payload: Dict[str, Any]) -> bool:
         if not self.endpoint:
             logger.debug("HTTP connector: no endpoint configured, skipping push")
             return True  # Treat as success in development
+        if self._batch_size <= 1:
+            return await self._post(orjson.dumps(payload))
+
+        self._buffer.append(payload)
+        if len(self._buffer) >= self._batch_size:
+            return await self.flush()
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.ensure_future(self._flush_later())
+        return True
+
+    async def flush(self) -> bool:
+        """POST any buffered payloads as a single batch."""
+        task, self._flush_task = self._flush_task, None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+        if not self._buffer:
+            return True
+        batch, self._buffer = self._buffer, []
+        body = orjson.dumps(batch)
+        if len(body) > self.GZIP_MIN_BYTES:
+            ok = await self._post(gzip.compress(body, 5), {"Content-Encoding": "gzip"})
+        else:
+            ok = await self._post(body)
+        if not ok:
+            # Keep the batch for the next flush, ahead of anything pushed meanwhile
+            self._buffer[:0] = batch
+            overflow = len(self._buffer) - self._buffer_max
+            if overflow > 0:
+                del self._buffer[:overflow]
+                logger.warning("HTTP push buffer full — dropped %d oldest payloads", overflow)
+        return ok
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._batch_interval)
+        await self.flush()
+
+    async def _post(self, body: bytes, extra_headers: Optional[Dict[str, str]] = None) -> bool:
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.config.get('api_key', '')}",
+        }
+        if extra_headers:
+            headers.update(extra_headers)
         try:
-            body = json.dumps(payload).encode()
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.config.get('api_key', '')}",
-            }
-            req = urllib.request.Request(self.endpoint, data=body, headers=headers)
-            with urllib.request.urlopen(req, timeout=10) as resp:
+            async with self._get_session().post(
+                self.endpoint, data=body, headers=headers
+            ) as resp:
+                if resp.status >= 400:
+                    logger.error("HTTP push failed: %s %s", resp.status, resp.reason)
                 return 200 <= resp.status < 300
-        except urllib.error.HTTPError as exc:
-            logger.error("HTTP push failed: %s %s", exc.code, exc.reason)
-            return False
         except Exception as exc:  # pylint: disable=broad-except
             logger.error("HTTP push error: %s", exc)
             return False
@@ -83,10 +175,10 @@ class HTTPConnector(CloudConnector):
             return None
         try:
             url = f"{self.endpoint}/messages"
-            if topic:
-                url += f"?topic={topic}"
-            with urllib.request.urlopen(url, timeout=10) as resp:
-                return json.loads(resp.read())
+            params = {"topic": topic} if topic else None
+            async with self._get_session().get(url, params=params) as resp:
+                resp.raise_for_status()
+                return await resp.json(content_type=None)
         except Exception as exc:  # pylint: disable=broad-except
             logger.error("HTTP pull error: %s", exc)
             return None
@@ -107,7 +199,8 @@ class AWSConnector(CloudConnector):
                 region_name=self.config.get("aws_region", "us-east-1"),
             )
             topic = self.config.get("aws_topic", "esp32/telemetry")
-            client.publish(topic=topic, qos=1, payload=json.dumps(payload))
+            body = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+            client.publish(topic=topic, qos=1, payload=body)
             return True
         except ImportError:
             logger.warning("boto3 not installed — AWS push unavailable")
@@ -124,16 +217,37 @@ class GCPConnector(CloudConnector):
     """
     GCP Pub/Sub connector.
     Requires google-cloud-pubsub to be installed.
+
+    One PublisherClient is kept for the connector's lifetime; it batches
+    messages and publishes them from its own background threads, so
+    :meth:`push` only enqueues.
     """
 
+    def __init__(self, endpoint: str, config: Dict[str, Any]):
+        super().__init__(endpoint, config)
+        self._publisher: Optional[Any] = None
+
+    def _get_publisher(self) -> Any:
+        if self._publisher is None:
+            from google.cloud import pubsub_v1  # type: ignore
+            self._publisher = pubsub_v1.PublisherClient(
+                batch_settings=pubsub_v1.types.BatchSettings(
+                    max_messages=500, max_bytes=1 << 20, max_latency=0.1,
+                ),
+            )
+        return self._publisher
+
+    @staticmethod
+    def _on_publish_done(future: Any) -> None:
+        exc = future.exception()
+        if exc is not None:
+            logger.error("GCP publish failed: %s", exc)
+
     async def push(self, payload: Dict[str, Any]) -> bool:
         try:
-            from google.cloud import pubsub_v1  # type: ignore
-            publisher = pubsub_v1.PublisherClient()
             topic_path = self.endpoint  # should be "projects/{p}/topics/{t}"
-            data = json.dumps(payload).encode()
-            future = publisher.publish(topic_path, data)
-            future.result(timeout=10)
+            future = self._get_publisher().publish(topic_path, orjson.dumps(payload))
+            future.add_done_callback(self._on_publish_done)
             return True
         except ImportError:
             logger.warning("google-cloud-pubsub not installed — GCP push unavailable")
@@ -142,6 +256,12 @@ class GCPConnector(CloudConnector):
             logger.error("GCP push error: %s", exc)
             return False
 
+    async def aclose(self) -> None:
+        if self._publisher is not None:
+            # stop() blocks until pending batches are flushed
+            publisher, self._publisher = self._publisher, None
+            await asyncio.get_running_loop().run_in_executor(None, publisher.stop)
+
     async def pull(self, topic: Optional[str] = None) -> Optional[Dict[str, Any]]:
         return None
 
@@ -160,7 +280,7 @@ class AzureConnector(CloudConnector):
                 logger.warning("azure_connection_string not configured")
                 return False
             client = IoTHubDeviceClient.create_from_connection_string(conn_str)
-            msg = Message(json.dumps(payload))
+            msg = Message(orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS).decode())
             client.send_message(msg)
             client.shutdown()
             return True
@@ -173,3 +293,121 @@ class AzureConnector(CloudConnector):
 
     async def pull(self, topic: Optional[str] = None) -> Optional[Dict[str, Any]]:
         return None
+
+
+class BufferedCloudConnector(CloudConnector):
+    """
+    Offline-first wrapper around another connector.
+
+    ``push`` appends the payload to a SQLite (WAL) outbox and returns
+    immediately; a background task drains the outbox through the wrapped
+    connector in id order, deleting rows once they are accepted.  Rows
+    survive restarts, and the outbox is capped at ``max_rows`` by dropping
+    the oldest entries.
+
+    Several connectors may share one outbox file: each row is tagged with
+    ``target`` (connector type and endpoint) and a connector only sends,
+    counts and trims its own rows.
+    """
+
+    def __init__(
+        self,
+        inner: CloudConnector,
+        path: str,
+        max_rows: int = 10_000,
+        batch_size: int = 100,
+        retry_interval: float = 5.0,
+        target: Optional[str] = None,
+    ):
+        super().__init__(inner.endpoint, inner.config)
+        self.inner = inner
+        self.target = target or f"{type(inner).__name__}:{inner.endpoint}"
+        self.max_rows = max_rows
+        self.batch_size = batch_size
+        self.retry_interval = retry_interval
+        self._db = sqlite3.connect(path, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("PRAGMA journal_size_limit=4194304")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS outbox ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, target TEXT NOT NULL DEFAULT '', "
+            "payload BLOB NOT NULL)"
+        )
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(outbox)")}
+        if "target" not in columns:  # outbox written before rows were tagged
+            self._db.execute("ALTER TABLE outbox ADD COLUMN target TEXT NOT NULL DEFAULT ''")
+        self._db.execute("CREATE INDEX IF NOT EXISTS outbox_target ON outbox (target, id)")
+        self._count = self.pending()
+        self._wakeup = asyncio.Event()
+        self._drain_task: Optional[asyncio.Future] = None
+
+    def pending(self) -> int:
+        """Number of payloads waiting in the outbox."""
+        return self._db.execute(
+            "SELECT COUNT(*) FROM outbox WHERE target = ?", (self.target,)
+        ).fetchone()[0]
+
+    async def push(self, payload: Dict[str, Any]) -> bool:
+        self._db.execute(
+            "INSERT INTO outbox (target, payload) VALUES (?, ?)",
+            (self.target, orjson.dumps(payload)),
+        )
+        self._count += 1
+        if self._count > self.max_rows:
+            cur = self._db.execute(
+                "DELETE FROM outbox WHERE id IN (SELECT id FROM outbox WHERE target = ? "
+                "ORDER BY id LIMIT ?)",
+                (self.target, self._count - self.max_rows),
+            )
+            self._count -= cur.rowcount
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.ensure_future(self._drain_loop())
+        self._wakeup.set()
+        return True
+
+    async def flush(self) -> int:
+        """Send queued payloads until the outbox is empty or a push fails."""
+        sent = 0
+        while True:
+            rows = self._db.execute(
+                "SELECT id, payload FROM outbox WHERE target = ? ORDER BY id LIMIT ?",
+                (self.target, self.batch_size),
+            ).fetchall()
+            if not rows:
+                return sent
+            last_ok = None
+            for row_id, blob in rows:
+                if not await self.inner.push(orjson.loads(blob)):
+                    break
+                last_ok = row_id
+                sent += 1
+            if last_ok is not None:
+                cur = self._db.execute(
+                    "DELETE FROM outbox WHERE target = ? AND id <= ?", (self.target, last_ok)
+                )
+                self._count -= cur.rowcount
+            if last_ok != rows[-1][0]:
+                return sent
+
+    async def _drain_loop(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.error("Cloud outbox drain error: %s", exc)
+            if self.pending():
+                await asyncio.sleep(self.retry_interval)  # backend down — back off
+            else:
+                await self._wakeup.wait()
+
+    async def pull(self, topic: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        return await self.inner.pull(topic)
+
+    async def aclose(self) -> None:
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+            self._drain_task = None
+        await self.inner.aclose()
+        self._db.close()
@@ -7,7 +7,7 @@ Uses the 'bleak' library when available; gracefully degrades otherwise.
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +15,8 @@ logger = logging.getLogger(__name__)
 class BLEDevice:
     """Lightweight representation of a discovered BLE peripheral."""
 
+    __slots__ = ("address", "name", "rssi")
+
     def __init__(self, address: str, name: Optional[str], rssi: Optional[int]):
         self.address = address
         self.name = name or "Unknown"
@@ -46,10 +48,21 @@ class BLEManager:
         if not self._bleak_available:
             logger.warning("BLE scan unavailable (bleak not installed)")
             return []
+        # address → (name, rssi); repeat advertisements just overwrite the entry
+        seen: Dict[str, Tuple[Optional[str], Optional[int]]] = {}
+
+        def _on_advertisement(device: Any, adv: Any) -> None:
+            seen[device.address] = (device.name or adv.local_name, adv.rssi)
+
         try:
             from bleak import BleakScanner
-            devices = await BleakScanner.discover(timeout=duration)
-            return [BLEDevice(d.address, d.name, d.rssi) for d in devices]
+            scanner = BleakScanner(detection_callback=_on_advertisement)
+            await scanner.start()
+            try:
+                await asyncio.sleep(duration)
+            finally:
+                await scanner.stop()
+            return [BLEDevice(addr, name, rssi) for addr, (name, rssi) in seen.items()]
         except Exception as exc:  # pylint: disable=broad-except
             logger.error("BLE scan error: %s", exc)
             return []
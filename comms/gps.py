@@ -7,29 +7,26 @@ Also provides a simple async polling helper for continuous fix updates.
 
 import asyncio
 import logging
-import re
+import sys
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
+
+from orchestrator.clock import now_iso
 
 logger = logging.getLogger(__name__)
 
-# Minimal NMEA GGA pattern
-_GGA_RE = re.compile(
-    r"\$(?:GP|GN|GL)GGA,"          # talker + sentence
-    r"(?P<time>\d{6}(?:\.\d+)?),"  # hhmmss.ss
-    r"(?P<lat>\d{4}\.\d+),"        # ddmm.mmm
-    r"(?P<ns>[NS]),"
-    r"(?P<lon>\d{5}\.\d+),"        # dddmm.mmm
-    r"(?P<ew>[EW]),"
-    r"(?P<fix>\d),"                 # fix quality
-    r"(?P<sats>\d{2}),"
-    r"(?P<hdop>[\d.]+),"
-    r"(?P<alt>-?[\d.]+),M,"
-)
-
-
-@dataclass
+# GGA talker + sentence ids accepted by the parser
+_GGA_IDS = ("$GPGGA", "$GNGGA", "$GLGGA")
+
+# Raw-line prefixes worth decoding; GSV/RMC/VTG/etc. are skipped as bytes
+_GGA_PREFIXES = (b"$GPGGA", b"$GNGGA", b"$GLGGA")
+
+
+# dataclass(slots=...) needs Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class GPSFix:
     latitude: float
     longitude: float
@@ -69,34 +66,48 @@ class GPSManager:
     # ------------------------------------------------------------------
 
     @staticmethod
-    def parse_nmea(sentence: str) -> Optional[GPSFix]:
-        """Parse a single NMEA GGA sentence and return a GPSFix."""
-        m = _GGA_RE.match(sentence.strip())
-        if not m:
+    def parse_nmea(sentence: Union[str, bytes]) -> Optional[GPSFix]:
+        """Parse a single NMEA GGA sentence (str or raw bytes) and return a GPSFix."""
+        if isinstance(sentence, bytes):
+            sentence = sentence.decode("ascii", errors="ignore")
+        sentence = sentence.strip()
+        if sentence[:6] not in _GGA_IDS:
             return None
-        if m.group("fix") == "0":
+        # $xxGGA,time,lat,N/S,lon,E/W,fix,sats,hdop,alt,M,...
+        fields = sentence.split(",", 11)
+        if len(fields) < 11 or fields[10] != "M":
+            return None
+        time_str, lat_s, ns, lon_s, ew, fix_q = fields[1:7]
+        if fix_q == "0" or not fix_q:
             return None  # No fix
+        if ns not in ("N", "S") or ew not in ("E", "W") or len(time_str) < 6:
+            return None
+
+        try:
+            lat_raw = float(lat_s)
+            lon_raw = float(lon_s)
+            satellites = int(fields[7])
+            hdop = float(fields[8])
+            altitude = float(fields[9])
+        except ValueError:
+            return None
 
-        lat_raw = float(m.group("lat"))
         lat = int(lat_raw / 100) + (lat_raw % 100) / 60
-        if m.group("ns") == "S":
+        if ns == "S":
             lat = -lat
 
-        lon_raw = float(m.group("lon"))
         lon = int(lon_raw / 100) + (lon_raw % 100) / 60
-        if m.group("ew") == "W":
+        if ew == "W":
             lon = -lon
 
-        time_str = m.group("time")
-        ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT") + \
-             f"{time_str[:2]}:{time_str[2:4]}:{time_str[4:6]}Z"
+        ts = f"{now_iso()[:11]}{time_str[:2]}:{time_str[2:4]}:{time_str[4:6]}Z"
 
         return GPSFix(
             latitude=round(lat, 7),
             longitude=round(lon, 7),
-            altitude_m=float(m.group("alt")),
-            satellites=int(m.group("sats")),
-            hdop=float(m.group("hdop")),
+            altitude_m=altitude,
+            satellites=satellites,
+            hdop=hdop,
             timestamp=ts,
             raw=sentence,
         )
@@ -121,7 +132,9 @@ class GPSManager:
                 url=self.port, baudrate=self.baud
             )
             while self._running:
-                line = (await reader.readline()).decode("ascii", errors="ignore").strip()
+                line = (await reader.readline()).strip()
+                if not line.startswith(_GGA_PREFIXES):
+                    continue
                 fix = self.parse_nmea(line)
                 if fix:
                     self._latest_fix = fix
@@ -88,11 +88,45 @@ class WiFiManager:
     def int_to_ip(value: int) -> str:
         return socket.inet_ntoa(struct.pack("!I", value))
 
-    def scan_subnet(self, subnet: str = "192.168.1.0/24") -> List[str]:
-        """Return list of responding hosts in the given subnet (ARP scan fallback)."""
+    async def scan_subnet(
+        self,
+        subnet: str = "192.168.1.0/24",
+        port: int = 80,
+        timeout: float = 0.5,
+        concurrency: int = 64,
+    ) -> List[str]:
+        """
+        Return the hosts in ``subnet`` that answer a TCP probe on ``port``.
+
+        ``concurrency`` workers pull addresses lazily from the subnet, so
+        memory stays flat however large it is. A refused connection still
+        counts as responding, since the host sent back a RST.
+        """
         try:
             import ipaddress
-            net = ipaddress.IPv4Network(subnet, strict=False)
-            return [str(h) for h in net.hosts()]
-        except Exception:  # pylint: disable=broad-except
+            hosts = ipaddress.IPv4Network(subnet, strict=False).hosts()
+        except ValueError as exc:
+            logger.warning("Invalid subnet %s: %s", subnet, exc)
             return []
+
+        alive: List[Any] = []
+
+        async def _probe(ip: Any) -> bool:
+            try:
+                _, writer = await asyncio.wait_for(
+                    asyncio.open_connection(str(ip), port), timeout
+                )
+            except ConnectionRefusedError:
+                return True
+            except (OSError, asyncio.TimeoutError):
+                return False
+            writer.close()
+            return True
+
+        async def _worker() -> None:
+            for ip in hosts:  # shared iterator: each address is taken once
+                if await _probe(ip):
+                    alive.append(ip)
+
+        await asyncio.gather(*(_worker() for _ in range(max(1, concurrency))))
+        return [str(ip) for ip in sorted(alive)]
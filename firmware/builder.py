@@ -7,9 +7,9 @@ import asyncio
 import hashlib
 import logging
 import shutil
-import subprocess
 import tempfile
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -19,6 +19,52 @@ TEMPLATE_DIR = Path(__file__).parent / "templates"
 BUILD_DIR = Path(tempfile.gettempdir()) / "esp32_builds"
 
 
+@lru_cache(maxsize=64)
+def _load_template(path: str, mtime_ns: int) -> str:  # pylint: disable=unused-argument
+    # mtime_ns is part of the cache key so edited templates are re-read
+    return Path(path).read_text(encoding="utf-8")
+
+
+def read_template(name: str, template_dir: Path = TEMPLATE_DIR) -> Optional[str]:
+    """Return the source of ``<template_dir>/<name>.cpp``, or None if missing."""
+    path = template_dir / f"{name}.cpp"
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return None
+    return _load_template(str(path), mtime_ns)
+
+
+async def compile_sketch(source_file: Path, out_dir: Path, output: Path,
+                         timeout: float = 180) -> bool:
+    """
+    Compile ``source_file`` for esp32 with arduino-cli without blocking the
+    event loop, copying the produced image to ``output``.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        "arduino-cli", "compile",
+        "--fqbn", "esp32:esp32:esp32",
+        "--output-dir", str(out_dir),
+        str(source_file),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        _, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        logger.error("arduino-cli timed out after %ss", timeout)
+        return False
+    if proc.returncode != 0:
+        logger.error("arduino-cli stderr: %s", stderr.decode(errors="replace"))
+        return False
+    bins = list(out_dir.glob("*.bin"))
+    if bins:
+        shutil.copy(bins[0], output)
+    return True
+
+
 class FirmwareBuilder:
     """
     Builds ESP32 firmware images from templates.
@@ -49,14 +95,13 @@ class FirmwareBuilder:
             lines.append(f"#define {k.upper()} {v}")
         lines.append("")
 
-        base = TEMPLATE_DIR / f"{template}.cpp"
-        lines.append(base.read_text(encoding="utf-8") if base.exists() else
-                     self._default_source(version))
+        base = read_template(template)
+        lines.append(base if base is not None else self._default_source(version))
 
         for feat in features:
-            fp = TEMPLATE_DIR / f"{feat}.cpp"
-            if fp.exists():
-                lines += [f"// --- {feat} ---", fp.read_text(encoding="utf-8")]
+            src = read_template(feat)
+            if src is not None:
+                lines += [f"// --- {feat} ---", src]
 
         return "\n".join(lines)
 
@@ -80,7 +125,7 @@ void loop() {{ delay(1000); }}
         version = version or datetime.now(timezone.utc).strftime("%Y%m%d.%H%M%S")
 
         source = self.assemble(template, features, version, defines)
-        build_id = hashlib.sha256(source.encode()).hexdigest()[:12]
+        build_id = hashlib.blake2b(source.encode(), digest_size=6).hexdigest()
         out_dir = self.build_dir / build_id
         out_dir.mkdir(exist_ok=True)
         (out_dir / "main.cpp").write_text(source, encoding="utf-8")
@@ -88,23 +133,13 @@ void loop() {{ delay(1000); }}
         binary = out_dir / "firmware.bin"
         compiled = False
 
-        if shutil.which("arduino-cli"):
+        if binary.exists() and binary.stat().st_size > 64:
+            # Same source hash → same image; skip the arduino-cli run
+            compiled = True
+            logger.info("Firmware %s already compiled (cache hit)", build_id)
+        elif shutil.which("arduino-cli"):
             try:
-                result = subprocess.run(
-                    [
-                        "arduino-cli", "compile",
-                        "--fqbn", "esp32:esp32:esp32",
-                        "--output-dir", str(out_dir),
-                        str(out_dir / "main.cpp"),
-                    ],
-                    capture_output=True, text=True, timeout=180,
-                )
-                compiled = result.returncode == 0
-                if not compiled:
-                    logger.error("arduino-cli stderr: %s", result.stderr)
-                bins = list(out_dir.glob("*.bin"))
-                if bins:
-                    shutil.copy(bins[0], binary)
+                compiled = await compile_sketch(out_dir / "main.cpp", out_dir, binary)
             except Exception as exc:  # pylint: disable=broad-except
                 logger.error("Build error: %s", exc)
         else:
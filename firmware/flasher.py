@@ -4,53 +4,89 @@ via the device HTTP OTA endpoint.
 """
 
 import asyncio
-import http.server
 import logging
-import os
-import threading
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-logger = logging.getLogger(__name__)
-
-
-class _BinaryHTTPHandler(http.server.SimpleHTTPRequestHandler):
-    """Minimal HTTP handler that serves a single binary file."""
+import aiohttp
+from aiohttp import web
 
-    def log_message(self, fmt, *args):  # suppress noisy access log
-        pass
+logger = logging.getLogger(__name__)
 
 
 class OTAFlasher:
     """
-    Serves a firmware binary over a temporary HTTP server and triggers
-    OTA updates on one or more ESP32 devices.
+    Serves firmware binaries over HTTP and triggers OTA updates on one or
+    more ESP32 devices.
+
+    A single aiohttp server is started on the first flash and kept up until
+    :meth:`close`; each binary is published under its own URL path.
     """
 
     def __init__(self, host_ip: Optional[str] = None, port: int = 8888):
         self.host_ip = host_ip or self._get_local_ip()
         self.port = port
-        self._server: Optional[http.server.HTTPServer] = None
-        self._server_thread: Optional[threading.Thread] = None
+        self._runner: Optional[Any] = None
+        self._server_lock = asyncio.Lock()
+        self._files: Dict[str, Path] = {}  # url path → binary on disk
+        self._session: Optional[Any] = None  # keep-alive pool for device OTA commands
 
     # ------------------------------------------------------------------
     # HTTP server lifecycle
     # ------------------------------------------------------------------
 
-    def _start_server(self, serve_dir: str) -> None:
-        os.chdir(serve_dir)
-        self._server = http.server.HTTPServer(("", self.port), _BinaryHTTPHandler)
-        self._server_thread = threading.Thread(
-            target=self._server.serve_forever, daemon=True
-        )
-        self._server_thread.start()
-        logger.info("OTA HTTP server started on %s:%d", self.host_ip, self.port)
-
-    def _stop_server(self) -> None:
-        if self._server:
-            self._server.shutdown()
-            self._server = None
-        logger.info("OTA HTTP server stopped")
+    async def _ensure_server(self) -> None:
+        async with self._server_lock:
+            if self._runner is not None:
+                return
+            async def _serve(request: Any) -> Any:
+                path = self._files.get(request.match_info["key"])
+                if path is None or not path.is_file():
+                    raise web.HTTPNotFound()
+                # FileResponse hands the body to loop.sendfile(), i.e. sendfile(2)
+                # from the page cache — no userspace copy of the image
+                return web.FileResponse(path)
+
+            app = web.Application()
+            app.router.add_get("/{key:.+}", _serve)
+            runner = web.AppRunner(app, access_log=None)
+            await runner.setup()
+            try:
+                await web.TCPSite(runner, port=self.port).start()
+            except BaseException:
+                await runner.cleanup()  # e.g. port already in use
+                raise
+            self._runner = runner
+            if not self.port:
+                # Port 0: each listening family gets its own port; the URL
+                # advertises an IPv4 host, so take the IPv4 one
+                self.port = next(a[1] for a in runner.addresses if len(a) == 2)
+            logger.info("OTA HTTP server started on %s:%d", self.host_ip, self.port)
+
+    def _get_session(self) -> Any:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=30),
+            )
+        return self._session
+
+    async def _publish(self, path: Path) -> str:
+        """Expose ``path`` on the OTA server and return its URL."""
+        await self._ensure_server()
+        key = f"{path.parent.name}/{path.name}"
+        self._files[key] = path
+        return f"http://{self.host_ip}:{self.port}/{key}"
+
+    async def close(self) -> None:
+        """Shut the OTA HTTP server down and release the device session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+            self._files.clear()
+            logger.info("OTA HTTP server stopped")
 
     # ------------------------------------------------------------------
     # Flash a single device
@@ -62,20 +98,15 @@ class OTAFlasher:
         """
         Flash `binary_path` to `device` via OTA.
 
-        Starts a temporary HTTP server, sends the OTA command, then tears
-        the server down.
+        Publishes the binary on the OTA server and sends the OTA command.
         """
         path = Path(binary_path)
         if not path.exists():
             return {"ok": False, "device_id": device.device_id, "reason": "binary_not_found"}
 
-        self._start_server(str(path.parent))
-        firmware_url = f"http://{self.host_ip}:{self.port}/{path.name}"
-        try:
-            ok = await device.flash_firmware(firmware_url)
-            return {"ok": ok, "device_id": device.device_id, "firmware_url": firmware_url}
-        finally:
-            self._stop_server()
+        firmware_url = await self._publish(path)
+        ok = await device.flash_firmware(firmware_url, session=self._get_session())
+        return {"ok": ok, "device_id": device.device_id, "firmware_url": firmware_url}
 
     # ------------------------------------------------------------------
     # Flash multiple devices simultaneously
@@ -90,24 +121,21 @@ class OTAFlasher:
             return [{"ok": False, "device_id": d.device_id, "reason": "binary_not_found"}
                     for d in devices]
 
-        self._start_server(str(path.parent))
-        firmware_url = f"http://{self.host_ip}:{self.port}/{path.name}"
-        try:
-            results = await asyncio.gather(
-                *[device.flash_firmware(firmware_url) for device in devices],
-                return_exceptions=True,
-            )
-            return [
-                {
-                    "ok": r is True,
-                    "device_id": devices[i].device_id,
-                    "firmware_url": firmware_url,
-                    "error": str(r) if isinstance(r, Exception) else None,
-                }
-                for i, r in enumerate(results)
-            ]
-        finally:
-            self._stop_server()
+        firmware_url = await self._publish(path)
+        session = self._get_session()
+        results = await asyncio.gather(
+            *[device.flash_firmware(firmware_url, session=session) for device in devices],
+            return_exceptions=True,
+        )
+        return [
+            {
+                "ok": r is True,
+                "device_id": devices[i].device_id,
+                "firmware_url": firmware_url,
+                "error": str(r) if isinstance(r, Exception) else None,
+            }
+            for i, r in enumerate(results)
+        ]
 
     # ------------------------------------------------------------------
     # Utility
@@ -3,30 +3,157 @@ Logging configuration — structured JSON logging with file rotation,
 console output, and optional remote syslog.
 """
 
+import atexit
+import copy
 import logging
 import logging.handlers
 import os
+import queue
 import sys
+import threading
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+
+try:
+    import orjson
+
+    def _json_dumps(doc: Any) -> str:
+        return orjson.dumps(doc, default=str).decode()
+except ImportError:  # pragma: no cover - orjson is a core dependency
+    import json
+
+    def _json_dumps(doc: Any) -> str:
+        return json.dumps(doc, default=str)
+
+# Background listener that owns the real handlers (see setup_logging)
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional["_LocalQueueHandler"] = None
+_flush_stop: Optional[threading.Event] = None
+
+# Buffered file output: records per write, and max seconds a record waits
+FILE_BUFFER_CAPACITY = 512
+FILE_FLUSH_INTERVAL = 5.0
+
+
+def _periodic_flush(handler: logging.Handler, stop: threading.Event) -> None:
+    while not stop.wait(FILE_FLUSH_INTERVAL):
+        handler.flush()
+
+
+def _stop_listener() -> None:
+    """Stop the background log listener, if running, and close its handlers."""
+    global _listener, _flush_stop
+    if _flush_stop is not None:
+        _flush_stop.set()
+        _flush_stop = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.flush()
+            handler.close()
+        _listener = None
+
+
+class _FastRotatingHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler that tracks the file size in a counter instead of
+    seeking to the end of the file for every record.
+
+    Records are written without a per-record flush; the wrapping
+    ``_BatchHandler`` flushes once per batch.
+    """
+
+    _bytes = 0
+
+    def _open(self):
+        stream = super()._open()
+        try:
+            self._bytes = os.fstat(stream.fileno()).st_size
+        except OSError:
+            self._bytes = 0
+        return stream
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            size = len(msg.encode(self.encoding or "utf-8"))
+            if self.stream is None:
+                self.stream = self._open()
+            if 0 < self.maxBytes <= self._bytes + size and self._bytes > 0:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._bytes += size
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
+
+
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for a listener in the same process.
+
+    The stock ``prepare`` formats the record and drops ``exc_info`` so the
+    record can be pickled; here it is never pickled, so only the message
+    is merged and the real handlers still see the exception.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
+class _BatchHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that also flushes the target's stream after each batch."""
+
+    def flush(self) -> None:
+        super().flush()
+        if self.target is not None:
+            self.target.flush()
+
+    def close(self) -> None:
+        # MemoryHandler.close() flushes but leaves the target (and its file) open
+        target = self.target
+        super().close()
+        if target is not None:
+            target.close()
 
 
 class JSONFormatter(logging.Formatter):
     """Emit log records as single-line JSON for machine parsing."""
 
-    def format(self, record: logging.LogRecord) -> str:
-        import json
-        from datetime import datetime, timezone
+    _last_second = -1
+    _second_prefix = ""
+
+    def _timestamp(self, created: float) -> str:
+        # Same text as datetime.fromtimestamp(created, timezone.utc).isoformat();
+        # the date/time part is rebuilt at most once a second
+        second = int(created)
+        micros = round((created - second) * 1e6)
+        if micros >= 1_000_000:
+            second += 1
+            micros -= 1_000_000
+        if second != self._last_second:
+            self._second_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._last_second = second
+        if micros:
+            return f"{self._second_prefix}.{micros:06d}+00:00"
+        return f"{self._second_prefix}+00:00"
 
+    def format(self, record: logging.LogRecord) -> str:
         doc = {
-            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
         if record.exc_info:
             doc["exception"] = self.formatException(record.exc_info)
-        return json.dumps(doc)
+        return _json_dumps(doc)
 
 
 def setup_logging(
@@ -46,7 +173,12 @@ def setup_logging(
     json_format : Use JSON formatter instead of human-readable format.
     max_bytes   : Max size per log file before rotation.
     backup_count: Number of rotated files to keep.
+
+    Records are handed to a ``QueueHandler`` on the root logger; the console
+    and file handlers run on a ``QueueListener`` thread so log calls made
+    from the event loop never block on I/O.
     """
+    global _listener, _queue_handler, _flush_stop
     root = logging.getLogger()
     root.setLevel(getattr(logging, level.upper(), logging.INFO))
 
@@ -61,26 +193,54 @@ def setup_logging(
     # Console handler
     console = logging.StreamHandler(sys.stdout)
     console.setFormatter(formatter)
-    root.addHandler(console)
+    handlers = [console]
 
     # File handler (optional)
     if log_dir:
         log_path = Path(log_dir)
         log_path.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = _FastRotatingHandler(
             log_path / "orchestrator.log",
             maxBytes=max_bytes,
             backupCount=backup_count,
             encoding="utf-8",
         )
         file_handler.setFormatter(formatter)
-        root.addHandler(file_handler)
+        # Write the file in batches; ERROR and above still flush immediately
+        buffered = _BatchHandler(
+            FILE_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True,
+        )
+        handlers.append(buffered)
+
+    # Replace any listener from a previous call
+    _stop_listener()
+    if _queue_handler is not None:
+        root.removeHandler(_queue_handler)
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _queue_handler = _LocalQueueHandler(log_queue)
+    root.addHandler(_queue_handler)
+    _listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _listener.start()
+    if log_dir:
+        _flush_stop = threading.Event()
+        threading.Thread(
+            target=_periodic_flush, args=(buffered, _flush_stop),
+            name="log-flush", daemon=True,
+        ).start()
 
     # Quiet noisy third-party loggers
     for noisy in ("urllib3", "asyncio", "uvicorn.access"):
         logging.getLogger(noisy).setLevel(logging.WARNING)
 
 
+atexit.register(_stop_listener)
+
+
 def get_logger(name: str) -> logging.Logger:
     """Return a named logger (thin wrapper for discoverability)."""
     return logging.getLogger(name)
@@ -4,22 +4,34 @@ alert thresholds and callback hooks.
 """
 
 import asyncio
+import itertools
 import logging
+import time
 from collections import defaultdict, deque
-from datetime import datetime, timezone
-from typing import Any, Callable, Deque, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+import aiohttp
+
+from orchestrator.clock import now_iso
 
 logger = logging.getLogger(__name__)
 
+# Samples kept per device
+HISTORY_LEN = 200
+
 
 class Alert:
+    """A threshold violation.  Treated as immutable once created."""
+
+    __slots__ = ("device_id", "metric", "value", "threshold", "message", "timestamp")
+
     def __init__(self, device_id: str, metric: str, value: Any, threshold: Any, message: str):
         self.device_id = device_id
         self.metric = metric
         self.value = value
         self.threshold = threshold
         self.message = message
-        self.timestamp = datetime.now(timezone.utc).isoformat()
+        self.timestamp = now_iso()
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -42,6 +54,13 @@ class TelemetryMonitor:
         await monitor.start()
     """
 
+    # Max devices polled at once
+    POLL_CONCURRENCY = 32
+    # Alert callbacks still running before new deliveries are dropped
+    MAX_PENDING_CALLBACKS = 256
+    # Seconds stop() waits for in-flight callbacks
+    CALLBACK_TIMEOUT = 1.0
+
     DEFAULT_THRESHOLDS = {
         "rssi": {"min": -90},
         "free_heap_bytes": {"min": 10_000},
@@ -52,10 +71,18 @@ class TelemetryMonitor:
         self.orchestrator = orchestrator
         self.poll_interval = poll_interval
         self._thresholds: Dict[str, Dict[str, Any]] = dict(self.DEFAULT_THRESHOLDS)
+        # (metric, min, max) rows derived from _thresholds for the poll hot path
+        self._threshold_vec: List[Tuple[str, Any, Any]] = []
+        self._rebuild_threshold_vec()
         self._alert_history: Deque[Alert] = deque(maxlen=1000)
-        self._alert_callbacks: List[Callable[[Alert], None]] = []
-        self._telemetry_history: Dict[str, Deque[Dict]] = defaultdict(lambda: deque(maxlen=200))
+        self._alert_callbacks: List[Callable[[Alert], Any]] = []
+        self._pending_callbacks: Set[asyncio.Future] = set()
+        self._telemetry_history: Dict[str, Deque[Dict]] = defaultdict(
+            lambda: deque(maxlen=HISTORY_LEN)
+        )
         self._running = False
+        self._session: Optional[Any] = None  # keep-alive pool for device polls
+        self._task: Optional[asyncio.Task] = None
 
     # ------------------------------------------------------------------
     # Configuration
@@ -64,8 +91,17 @@ class TelemetryMonitor:
     def set_threshold(self, metric: str, min_value: Optional[float] = None,
                       max_value: Optional[float] = None) -> None:
         self._thresholds[metric] = {"min": min_value, "max": max_value}
+        self._rebuild_threshold_vec()
 
-    def on_alert(self, callback: Callable[[Alert], None]) -> None:
+    def _rebuild_threshold_vec(self) -> None:
+        self._threshold_vec = [
+            (metric, bounds.get("min"), bounds.get("max"))
+            for metric, bounds in self._thresholds.items()
+            if bounds.get("min") is not None or bounds.get("max") is not None
+        ]
+
+    def on_alert(self, callback: Callable[[Alert], Any]) -> None:
+        """Register a plain function or coroutine function to receive alerts."""
         self._alert_callbacks.append(callback)
 
     # ------------------------------------------------------------------
@@ -76,11 +112,23 @@ class TelemetryMonitor:
         if self._running:
             return
         self._running = True
-        asyncio.ensure_future(self._poll_loop())
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=30),
+        )
+        self._task = asyncio.create_task(self._poll_loop())
         logger.info("TelemetryMonitor started (poll=%.1fs)", self.poll_interval)
 
     async def stop(self) -> None:
         self._running = False
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._pending_callbacks:
+            await asyncio.wait(self._pending_callbacks, timeout=self.CALLBACK_TIMEOUT)
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     # ------------------------------------------------------------------
     # Polling
@@ -88,30 +136,34 @@ class TelemetryMonitor:
 
     async def _poll_loop(self) -> None:
         while self._running:
-            for device in self.orchestrator.list_devices():
+            devices = self.orchestrator.list_devices()
+            if devices:
                 try:
-                    await self._poll_device(device)
+                    results = await self.orchestrator.bulk_get_telemetry(
+                        [d.device_id for d in devices],
+                        session=self._session,
+                        concurrency=self.POLL_CONCURRENCY,
+                    )
                 except Exception as exc:  # pylint: disable=broad-except
-                    logger.debug("Monitor poll error for %s: %s", device.device_id, exc)
+                    logger.debug("Monitor poll error: %s", exc)
+                    results = {}
+                for device in devices:
+                    resp = results.get(device.device_id)
+                    if resp is not None:
+                        self._apply_telemetry(device, resp)
             await asyncio.sleep(self.poll_interval)
 
-    async def _poll_device(self, device: Any) -> None:
-        """Fetch latest telemetry from a device and check thresholds."""
-        try:
-            resp = await device.send_command("get_telemetry")
-        except Exception:  # pylint: disable=broad-except
-            return
-
-        telemetry = {**resp, "timestamp": datetime.now(timezone.utc).isoformat()}
+    def _apply_telemetry(self, device: Any, resp: Dict[str, Any]) -> None:
+        """Record a device's latest telemetry and check thresholds."""
+        telemetry = {**resp, "timestamp": now_iso()}
         device.update_telemetry(telemetry)
         self._telemetry_history[device.device_id].append(telemetry)
 
-        for metric, bounds in self._thresholds.items():
-            value = telemetry.get(metric)
+        tget = telemetry.get
+        for metric, min_v, max_v in self._threshold_vec:
+            value = tget(metric)
             if value is None:
                 continue
-            min_v = bounds.get("min")
-            max_v = bounds.get("max")
             if min_v is not None and value < min_v:
                 self._raise_alert(device.device_id, metric, value, min_v,
                                   f"{metric} below minimum threshold")
@@ -124,11 +176,38 @@ class TelemetryMonitor:
         alert = Alert(device_id, metric, value, threshold, message)
         self._alert_history.append(alert)
         logger.warning("ALERT [%s] %s=%s (threshold=%s)", device_id, metric, value, threshold)
+        if not self._alert_callbacks:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
         for cb in self._alert_callbacks:
-            try:
-                cb(alert)
-            except Exception as exc:  # pylint: disable=broad-except
-                logger.error("Alert callback error: %s", exc)
+            if loop is None:
+                # No event loop (sync caller) — deliver inline
+                try:
+                    if asyncio.iscoroutinefunction(cb):
+                        asyncio.run(cb(alert))
+                    else:
+                        cb(alert)
+                except Exception as exc:  # pylint: disable=broad-except
+                    logger.error("Alert callback error: %s", exc)
+                continue
+            # Keep slow subscribers off the poll loop
+            if len(self._pending_callbacks) >= self.MAX_PENDING_CALLBACKS:
+                logger.warning("Alert callback backlog full — dropping delivery for %s", device_id)
+                continue
+            if asyncio.iscoroutinefunction(cb):
+                fut = loop.create_task(cb(alert))
+            else:
+                fut = loop.run_in_executor(None, cb, alert)
+            self._pending_callbacks.add(fut)
+            fut.add_done_callback(self._callback_done)
+
+    def _callback_done(self, fut: asyncio.Future) -> None:
+        self._pending_callbacks.discard(fut)
+        if not fut.cancelled() and fut.exception() is not None:
+            logger.error("Alert callback error: %s", fut.exception())
 
     # ------------------------------------------------------------------
     # Queries
@@ -140,5 +219,13 @@ class TelemetryMonitor:
             alerts = [a for a in alerts if a.device_id == device_id]
         return [a.to_dict() for a in alerts]
 
-    def get_telemetry_history(self, device_id: str) -> List[Dict[str, Any]]:
-        return list(self._telemetry_history.get(device_id, []))
+    def get_telemetry_history(
+        self, device_id: str, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Return a device's telemetry history, oldest first; ``limit`` keeps the newest N."""
+        history = self._telemetry_history.get(device_id)
+        if not history:
+            return []
+        if limit is not None and limit < len(history):
+            return list(itertools.islice(history, len(history) - limit, None))
+        return list(history)
@@ -12,7 +12,9 @@ import argparse
 import asyncio
 import logging
 import sys
+import threading
 from pathlib import Path
+from typing import Awaitable, Callable, Optional
 
 from logging_system.logger import setup_logging
 
@@ -46,8 +48,12 @@ def load_config(config_path: str) -> dict:
     """Load YAML config if available, else return empty dict."""
     try:
         import yaml
+        try:
+            from yaml import CSafeLoader as SafeLoader
+        except ImportError:
+            from yaml import SafeLoader
         with open(config_path, encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+            return yaml.load(f, Loader=SafeLoader) or {}
     except FileNotFoundError:
         logger.info("Config file not found at %s — using defaults", config_path)
         return {}
@@ -74,7 +80,10 @@ def run_server(orchestrator, host: str = "0.0.0.0", port: int = 8000):
     logger.info("Starting API server on http://%s:%d", host, port)
     logger.info("  Docs: http://%s:%d/docs", host, port)
     logger.info("  WS:   ws://%s:%d/ws/telemetry", host, port)
-    uvicorn.run(app, host=host, port=port, log_level="info")
+    # permessage-deflate with context takeover suits the repetitive status frames
+    ws_deflate = orchestrator.config.get("server", {}).get("ws_per_message_deflate", True)
+    uvicorn.run(app, host=host, port=port, log_level="info",
+                ws_per_message_deflate=ws_deflate)
 
 
 # ------------------------------------------------------------------
@@ -166,15 +175,54 @@ async def run_demo(orchestrator):
 # CLI mode
 # ------------------------------------------------------------------
 
+def _make_prompt() -> Callable[[str], Awaitable[str]]:
+    """
+    Return an async line reader that leaves the event loop running while
+    the user types.  Uses prompt_toolkit when installed, else reads stdin on
+    a daemon thread (so a pending read never blocks interpreter exit).
+    """
+    try:
+        from prompt_toolkit import PromptSession
+        return PromptSession().prompt_async
+    except ImportError:
+        pass
+
+    loop = asyncio.get_running_loop()
+
+    def _resolve(fut: asyncio.Future, line: Optional[str], exc: Optional[BaseException]) -> None:
+        if fut.done():
+            return
+        if exc is not None:
+            fut.set_exception(exc)
+        else:
+            fut.set_result(line)
+
+    def _read(fut: asyncio.Future, message: str) -> None:
+        try:
+            line = input(message)
+        except EOFError as exc:
+            loop.call_soon_threadsafe(_resolve, fut, None, exc)
+        else:
+            loop.call_soon_threadsafe(_resolve, fut, line, None)
+
+    async def _prompt(message: str) -> str:
+        fut = loop.create_future()
+        threading.Thread(target=_read, args=(fut, message), name="cli-input", daemon=True).start()
+        return await fut
+
+    return _prompt
+
+
 async def run_cli(orchestrator):
     """Simple interactive CLI for manual control."""
     await orchestrator.start()
     print("Multi-Agent ESP32 CLI. Type 'help' for commands, 'exit' to quit.")
+    prompt = _make_prompt()
 
     while True:
         try:
-            line = input("\n> ").strip()
-        except (KeyboardInterrupt, EOFError):
+            line = (await prompt("\n> ")).strip()
+        except (KeyboardInterrupt, EOFError, asyncio.CancelledError):
             break
 
         if not line:
@@ -191,10 +239,10 @@ async def run_cli(orchestrator):
             print(json.dumps(orchestrator.get_status(), indent=2))
         elif line == "devices":
             for d in orchestrator.list_devices():
-                print(f"  {d.device_id}: {d.name} [{d.status.value}]")
+                print(f"  {d.device_id}: {d.name} [{d.status_str}]")
         elif line == "agents":
             for a in orchestrator.list_agents():
-                print(f"  {a.agent_id[:8]}: {a.agent_type} [{a.status.value}]")
+                print(f"  {a.agent_id[:8]}: {a.agent_type} [{a.status_str}]")
         else:
             print(f"  Unknown command: {line}")
 
@@ -205,6 +253,17 @@ async def run_cli(orchestrator):
 # Entry point
 # ------------------------------------------------------------------
 
+def _use_uvloop() -> None:
+    """Switch asyncio to uvloop when it is installed (ships with uvicorn[standard])."""
+    try:
+        import uvloop  # type: ignore
+    except ImportError:
+        logger.debug("uvloop not installed — using the default asyncio event loop")
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("Using uvloop event loop")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Multi-Agent ESP32 Orchestration System"
@@ -229,6 +288,7 @@ def main():
 
     config = load_config(args.config)
     orchestrator = build_orchestrator(config)
+    _use_uvloop()
 
     if args.mode == "server":
         run_server(orchestrator, host=args.host, port=args.port)
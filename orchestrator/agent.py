@@ -4,6 +4,7 @@ Agent base class.  All specialised agents inherit from AgentBase.
 
 import asyncio
 import logging
+import time
 import uuid
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
@@ -42,10 +43,21 @@ class AgentBase(ABC):
         self._metrics: Dict[str, Any] = {
             "tasks_completed": 0,
             "tasks_failed": 0,
-            "last_task_at": None,
         }
+        # Epoch seconds of the last task; formatted as ISO only in get_metrics
+        self.last_task_ts: Optional[float] = None
         logger.debug("Agent created: %s (%s)", agent_type, self.agent_id)
 
+    @property
+    def status(self) -> AgentStatus:
+        return self._status
+
+    @status.setter
+    def status(self, value: AgentStatus) -> None:
+        # ``status_str`` mirrors ``status.value`` for hot read paths
+        self._status = value
+        self.status_str: str = value.value
+
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
@@ -79,18 +91,19 @@ class AgentBase(ABC):
         device: Optional["ESP32Device"] = None,
     ) -> Any:
         """Execute a task.  Wraps `_execute` with status tracking."""
+        metrics = self._metrics
         self.status = AgentStatus.BUSY
-        self._metrics["last_task_at"] = datetime.now(timezone.utc).isoformat()
+        self.last_task_ts = time.time()
         try:
             result = await self._execute(task, params, device)
-            self._metrics["tasks_completed"] += 1
-            self.status = AgentStatus.IDLE
-            return result
         except Exception as exc:  # pylint: disable=broad-except
-            self._metrics["tasks_failed"] += 1
+            metrics["tasks_failed"] += 1
             self.status = AgentStatus.ERROR
             logger.error("Agent %s task '%s' failed: %s", self.agent_type, task, exc)
             raise
+        metrics["tasks_completed"] += 1
+        self.status = AgentStatus.IDLE
+        return result
 
     @abstractmethod
     async def _execute(
@@ -109,6 +122,10 @@ class AgentBase(ABC):
         return {
             "agent_id": self.agent_id,
             "agent_type": self.agent_type,
-            "status": self.status.value,
+            "status": self.status_str,
             **self._metrics,
+            "last_task_at": (
+                datetime.fromtimestamp(self.last_task_ts, timezone.utc).isoformat()
+                if self.last_task_ts is not None else None
+            ),
         }
@@ -0,0 +1,22 @@
+"""
+Cheap wall-clock timestamps for the orchestrator's hot paths.
+"""
+
+import time
+from datetime import datetime, timezone
+from typing import Any, List
+
+# Seconds a formatted timestamp is reused before it is rebuilt
+ISO_CACHE_SECONDS = 0.1
+
+# [monotonic expiry, ISO string]
+_cache: List[Any] = [0.0, ""]
+
+
+def now_iso() -> str:
+    """Current UTC time as ISO-8601, reformatted at most every ISO_CACHE_SECONDS."""
+    mono = time.monotonic()
+    if mono >= _cache[0]:
+        _cache[1] = datetime.now(timezone.utc).isoformat()
+        _cache[0] = mono + ISO_CACHE_SECONDS
+    return _cache[1]
@@ -5,18 +5,34 @@ task dispatch, and event broadcasting.
 """
 
 import asyncio
+import functools
+import itertools
 import logging
-import uuid
-from collections import defaultdict
-from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import aiohttp
 
 from .agent import AgentBase, AgentStatus
+from .clock import now_iso
 from .device import ESP32Device, DeviceStatus
 from .scheduler import TaskScheduler
 
 logger = logging.getLogger(__name__)
 
+# Task ids only need to be unique within this process: pid + start time + counter
+_TASK_ID_PREFIX = f"{os.getpid():x}-{int(time.time()):x}-"
+_task_counter = itertools.count()
+
+
+def _call_listener(event: str, callback: Callable, data: Any) -> None:
+    try:
+        callback(data)
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.error("Event listener error (%s): %s", event, exc)
+
 
 class Orchestrator:
     """
@@ -27,16 +43,33 @@ class Orchestrator:
     deployment — all in real time.
     """
 
+    # Max device pings in flight during a health check
+    HEALTH_CHECK_CONCURRENCY = 64
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
         self._agents: Dict[str, AgentBase] = {}
+        self._agents_by_type: Dict[str, List[AgentBase]] = {}
         self._devices: Dict[str, ESP32Device] = {}
+        self._devices_view: Optional[Tuple[ESP32Device, ...]] = None
+        self._devices_version = 0
         self._scheduler = TaskScheduler()
-        self._event_listeners: Dict[str, List[Callable]] = defaultdict(list)
+        # event → listeners; tuples are rebuilt on registration, never per emit
+        self._event_listeners: Dict[str, Tuple[Callable, ...]] = {}
         self._running = False
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._health_check_interval = self.config.get("health_check_interval", 10)
-        self._task_results: Dict[str, Any] = {}
+        self._health_task: Optional[asyncio.Task] = None
+        # Development aids for spotting code that blocks the event loop
+        self._loop_debug = self.config.get("loop_debug", False)
+        self._slow_callback_sec = self.config.get("slow_callback_sec", 0.1)
+        self._slow_task_sec: Optional[float] = self.config.get("slow_task_sec")
+        # Set while at least one device is registered; idles the health-check loop
+        self._has_devices = asyncio.Event()
+        # Completed task results, least recently used first
+        self._task_results: "OrderedDict[str, Any]" = OrderedDict()
+        self._max_task_results = self.config.get("max_task_results", 10_000)
+        self._http: Optional[Any] = None  # pooled aiohttp session, open while running
         logger.info("Orchestrator initialised")
 
     # ------------------------------------------------------------------
@@ -49,6 +82,9 @@ class Orchestrator:
             logger.warning("Device %s already registered", device.device_id)
             return device.device_id
         self._devices[device.device_id] = device
+        device.http_session = self._http
+        self._devices_changed()
+        self._has_devices.set()
         self._emit_event("device_registered", {"device_id": device.device_id, "device": device})
         logger.info("Registered device: %s (%s)", device.name, device.device_id)
         return device.device_id
@@ -58,6 +94,10 @@ class Orchestrator:
         device = self._devices.pop(device_id, None)
         if device is None:
             return False
+        device.http_session = None
+        self._devices_changed()
+        if not self._devices:
+            self._has_devices.clear()
         self._emit_event("device_unregistered", {"device_id": device_id})
         logger.info("Unregistered device: %s", device_id)
         return True
@@ -66,10 +106,65 @@ class Orchestrator:
         return self._devices.get(device_id)
 
     def list_devices(self) -> List[ESP32Device]:
-        return list(self._devices.values())
+        return list(self.devices_view())
+
+    def devices_view(self) -> Tuple[ESP32Device, ...]:
+        """
+        Return an immutable snapshot of the registered devices.
+
+        The tuple is rebuilt only when a device is registered or
+        unregistered, so hot read paths can share it without copying.
+        """
+        if self._devices_view is None:
+            self._devices_view = tuple(self._devices.values())
+        return self._devices_view
+
+    def devices_json(self) -> bytes:
+        """Return the device list as a JSON array, reusing per-device encodings."""
+        return b"[" + b",".join(d.to_json_bytes() for d in self.devices_view()) + b"]"
+
+    @property
+    def devices_version(self) -> int:
+        """Counter bumped whenever the set of registered devices changes."""
+        return self._devices_version
+
+    def _devices_changed(self) -> None:
+        self._devices_view = None
+        self._devices_version += 1
 
     def get_online_devices(self) -> List[ESP32Device]:
-        return [d for d in self._devices.values() if d.status == DeviceStatus.ONLINE]
+        return [d for d in self.devices_view() if d.status == DeviceStatus.ONLINE]
+
+    async def bulk_get_telemetry(
+        self,
+        device_ids: List[str],
+        session: Optional[Any] = None,
+        concurrency: int = 32,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch ``get_telemetry`` from many devices in one call.
+
+        Requests run concurrently (at most ``concurrency`` in flight) over the
+        shared keep-alive ``session``.  Unknown devices and failed requests
+        are left out of the result.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _fetch(device: ESP32Device) -> Optional[Dict[str, Any]]:
+            async with sem:
+                try:
+                    return await device.send_command("get_telemetry", session=session)
+                except Exception as exc:  # pylint: disable=broad-except
+                    logger.debug("Telemetry fetch failed for %s: %s", device.device_id, exc)
+                    return None
+
+        devices = [d for d in map(self._devices.get, device_ids) if d is not None]
+        responses = await asyncio.gather(*(_fetch(d) for d in devices))
+        return {
+            d.device_id: resp
+            for d, resp in zip(devices, responses)
+            if resp is not None
+        }
 
     # ------------------------------------------------------------------
     # Agent management
@@ -82,10 +177,25 @@ class Orchestrator:
             return agent.agent_id
         agent.orchestrator = self
         self._agents[agent.agent_id] = agent
+        self._agents_by_type.setdefault(agent.agent_type, []).append(agent)
         self._emit_event("agent_registered", {"agent_id": agent.agent_id, "agent_type": agent.agent_type})
         logger.info("Registered agent: %s (%s)", agent.agent_type, agent.agent_id)
         return agent.agent_id
 
+    def unregister_agent(self, agent_id: str) -> bool:
+        """Remove an agent from the orchestrator."""
+        agent = self._agents.pop(agent_id, None)
+        if agent is None:
+            return False
+        bucket = self._agents_by_type.get(agent.agent_type, [])
+        bucket.remove(agent)
+        if not bucket:
+            del self._agents_by_type[agent.agent_type]
+        agent.orchestrator = None
+        self._emit_event("agent_unregistered", {"agent_id": agent_id, "agent_type": agent.agent_type})
+        logger.info("Unregistered agent: %s (%s)", agent.agent_type, agent_id)
+        return True
+
     def get_agent(self, agent_id: str) -> Optional[AgentBase]:
         return self._agents.get(agent_id)
 
@@ -93,7 +203,7 @@ class Orchestrator:
         return list(self._agents.values())
 
     def get_agents_by_type(self, agent_type: str) -> List[AgentBase]:
-        return [a for a in self._agents.values() if a.agent_type == agent_type]
+        return list(self._agents_by_type.get(agent_type, ()))
 
     # ------------------------------------------------------------------
     # Task dispatch
@@ -111,7 +221,7 @@ class Orchestrator:
         if agent is None:
             raise ValueError(f"Unknown agent: {agent_id}")
 
-        task_id = str(uuid.uuid4())
+        task_id = f"{_TASK_ID_PREFIX}{next(_task_counter):x}"
         device = self._devices.get(device_id) if device_id else None
 
         logger.info("Dispatching task %s → agent %s (device=%s)", task, agent_id, device_id)
@@ -120,15 +230,23 @@ class Orchestrator:
             {"task_id": task_id, "agent_id": agent_id, "task": task, "device_id": device_id},
         )
 
+        started = time.monotonic()
         result = await agent.execute(task, params or {}, device)
-        self._task_results[task_id] = {
+        elapsed = time.monotonic() - started
+        if self._slow_task_sec is not None and elapsed > self._slow_task_sec:
+            logger.warning("Task %s on agent %s took %.3fs", task, agent_id, elapsed)
+        record = {
             "task_id": task_id,
             "agent_id": agent_id,
             "task": task,
             "result": result,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": now_iso(),
         }
-        self._emit_event("task_completed", self._task_results[task_id])
+        results = self._task_results
+        results[task_id] = record
+        while len(results) > self._max_task_results:
+            results.popitem(last=False)
+        self._emit_event("task_completed", record)
         return task_id
 
     async def broadcast_task(
@@ -142,13 +260,30 @@ class Orchestrator:
         if not agents:
             logger.warning("No agents of type %s found", agent_type)
             return []
-        task_ids = await asyncio.gather(
-            *[self.dispatch_task(a.agent_id, task, params) for a in agents]
-        )
-        return list(task_ids)
+        if len(agents) == 1:
+            return [await self.dispatch_task(agents[0].agent_id, task, params)]
+        loop = asyncio.get_running_loop()
+        tasks = [loop.create_task(self.dispatch_task(a.agent_id, task, params)) for a in agents]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            # Like a TaskGroup: on a failure (or our own cancellation) stop the
+            # siblings and let them unwind before propagating
+            pending = [t for t in tasks if not t.done()]
+            for t in pending:
+                t.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        errors = [t.exception() for t in tasks if not t.cancelled()]
+        for exc in errors:
+            if exc is not None:
+                raise exc
+        return [t.result() for t in tasks]
 
     def get_task_result(self, task_id: str) -> Optional[Dict[str, Any]]:
-        return self._task_results.get(task_id)
+        record = self._task_results.get(task_id)
+        if record is not None:
+            self._task_results.move_to_end(task_id)
+        return record
 
     # ------------------------------------------------------------------
     # Event system
@@ -156,15 +291,17 @@ class Orchestrator:
 
     def on(self, event: str, callback: Callable) -> None:
         """Register an event listener."""
-        self._event_listeners[event].append(callback)
+        # Wrapped once here so _emit_event can call listeners without a guard
+        safe = functools.partial(_call_listener, event, callback)
+        self._event_listeners[event] = self._event_listeners.get(event, ()) + (safe,)
 
     def _emit_event(self, event: str, data: Any) -> None:
         """Fire an event to all registered listeners."""
-        for cb in self._event_listeners.get(event, []):
-            try:
-                cb(data)
-            except Exception as exc:  # pylint: disable=broad-except
-                logger.error("Event listener error (%s): %s", event, exc)
+        listeners = self._event_listeners.get(event)
+        if not listeners:
+            return
+        for cb in listeners:
+            cb(data)
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -176,33 +313,77 @@ class Orchestrator:
             return
         self._running = True
         self._loop = asyncio.get_event_loop()
+        if self._loop_debug:
+            # asyncio then logs every callback that holds the loop too long
+            self._loop.set_debug(True)
+            self._loop.slow_callback_duration = self._slow_callback_sec
+        self._open_http()
         logger.info("Starting orchestrator with %d agent(s) and %d device(s)",
                     len(self._agents), len(self._devices))
 
         # Start all agents concurrently
         await asyncio.gather(*[a.start() for a in self._agents.values()], return_exceptions=True)
         # Start background health-check loop
-        asyncio.ensure_future(self._health_check_loop())
-        self._emit_event("orchestrator_started", {"timestamp": datetime.now(timezone.utc).isoformat()})
+        self._health_task = asyncio.ensure_future(self._health_check_loop())
+        self._emit_event("orchestrator_started", {"timestamp": now_iso()})
 
     async def stop(self) -> None:
         """Gracefully stop all agents and the orchestrator."""
         if not self._running:
             return
         self._running = False
+        if self._health_task is not None:
+            self._health_task.cancel()
+            await asyncio.gather(self._health_task, return_exceptions=True)
+            self._health_task = None
         await asyncio.gather(*[a.stop() for a in self._agents.values()], return_exceptions=True)
-        self._emit_event("orchestrator_stopped", {"timestamp": datetime.now(timezone.utc).isoformat()})
+        await self._scheduler.stop()
+        await self._close_http()
+        self._emit_event("orchestrator_stopped", {"timestamp": now_iso()})
         logger.info("Orchestrator stopped")
 
+    def _open_http(self) -> None:
+        """Create the keep-alive session shared by every device's commands."""
+        self._http = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=4, keepalive_timeout=30),
+        )
+        for device in self.devices_view():
+            device.http_session = self._http
+
+    async def _close_http(self) -> None:
+        if self._http is None:
+            return
+        for device in self.devices_view():
+            device.http_session = None
+        await self._http.close()
+        self._http = None
+
     async def _health_check_loop(self) -> None:
         """Periodically ping all registered devices."""
+        sem = asyncio.Semaphore(self.HEALTH_CHECK_CONCURRENCY)
+
+        async def _ping(device: ESP32Device) -> Any:
+            async with sem:
+                return await device.ping()
+
+        interval = self._health_check_interval
+        next_wake = time.monotonic() + interval
         while self._running:
-            await asyncio.sleep(self._health_check_interval)
-            for device in self._devices.values():
-                try:
-                    await device.ping()
-                except Exception as exc:  # pylint: disable=broad-except
-                    logger.warning("Health-check failed for %s: %s", device.device_id, exc)
+            delay = next_wake - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if not self._devices:
+                # No timer wakeups while the fleet is empty
+                await self._has_devices.wait()
+                next_wake = time.monotonic() + interval
+                continue
+            # Fixed cadence: the next round is timed from this one's start
+            next_wake = time.monotonic() + interval
+            devices = self.devices_view()
+            results = await asyncio.gather(*(_ping(d) for d in devices), return_exceptions=True)
+            for device, result in zip(devices, results):
+                if isinstance(result, Exception):
+                    logger.warning("Health-check failed for %s: %s", device.device_id, result)
 
     # ------------------------------------------------------------------
     # Status summary
@@ -216,19 +397,11 @@ class Orchestrator:
                 {
                     "agent_id": a.agent_id,
                     "agent_type": a.agent_type,
-                    "status": a.status.value,
+                    "status": a.status_str,
                 }
                 for a in self._agents.values()
             ],
-            "devices": [
-                {
-                    "device_id": d.device_id,
-                    "name": d.name,
-                    "status": d.status.value,
-                    "ip_address": d.ip_address,
-                }
-                for d in self._devices.values()
-            ],
+            "devices": [d.status_row() for d in self.devices_view()],
             "pending_tasks": self._scheduler.pending_count(),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": now_iso(),
         }
@@ -5,10 +5,14 @@ Stores connectivity info, current firmware version, and capability flags.
 
 import asyncio
 import logging
-from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
+import aiohttp
+import orjson
+
+from .clock import now_iso
+
 logger = logging.getLogger(__name__)
 
 
@@ -61,6 +65,24 @@ class ESP32Device:
         self.rssi: Optional[int] = None
         self.last_seen: Optional[str] = None
         self.telemetry: Dict[str, Any] = {}
+        # Shared aiohttp session injected by the orchestrator while it runs
+        self.http_session: Optional[Any] = None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Any attribute write invalidates the cached JSON encoding
+        if name != "_json":
+            object.__setattr__(self, "_json", None)
+        object.__setattr__(self, name, value)
+
+    @property
+    def status(self) -> DeviceStatus:
+        return self._status
+
+    @status.setter
+    def status(self, value: DeviceStatus) -> None:
+        # ``status_str`` mirrors ``status.value`` for hot read paths
+        self._status = value
+        self.status_str: str = value.value
 
     # ------------------------------------------------------------------
     # Connectivity
@@ -68,51 +90,75 @@ class ESP32Device:
 
     async def ping(self) -> bool:
         """
-        Ping the device over the network.
+        Probe the device with a TCP connect to its ``health_port`` (default 80).
         Returns True if the device responds, False otherwise.
+
+        A refused connection still proves the host is up, so it counts as a
+        response.
         """
         if not self.ip_address:
             self.status = DeviceStatus.OFFLINE
             return False
+        port = self.config.get("health_port", 80)
         try:
-            # Use asyncio subprocess for a non-blocking ping
-            proc = await asyncio.create_subprocess_exec(
-                "ping", "-c", "1", "-W", "2", self.ip_address,
-                stdout=asyncio.subprocess.DEVNULL,
-                stderr=asyncio.subprocess.DEVNULL,
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(self.ip_address, port), timeout=2
             )
-            await asyncio.wait_for(proc.communicate(), timeout=5)
-            online = proc.returncode == 0
-            self.status = DeviceStatus.ONLINE if online else DeviceStatus.OFFLINE
-            if online:
-                self.last_seen = datetime.now(timezone.utc).isoformat()
-            return online
+            writer.close()
+            online = True
+        except ConnectionRefusedError:
+            online = True
+        except (OSError, asyncio.TimeoutError):
+            online = False
         except Exception as exc:  # pylint: disable=broad-except
             logger.warning("Ping failed for %s: %s", self.device_id, exc)
-            self.status = DeviceStatus.OFFLINE
-            return False
+            online = False
+        self.status = DeviceStatus.ONLINE if online else DeviceStatus.OFFLINE
+        if online:
+            self.last_seen = now_iso()
+        return online
 
-    async def send_command(self, command: str, payload: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    async def send_command(
+        self,
+        command: str,
+        payload: Optional[Dict[str, Any]] = None,
+        session: Optional[Any] = None,
+    ) -> Dict[str, Any]:
         """
         Send a JSON command to the device via HTTP.
         Requires the device to be running the companion firmware.
-        """
-        import json
-        import urllib.request
 
+        Uses ``session`` if given, else the orchestrator's pooled
+        ``http_session``, so keep-alive connections are reused across calls.
+        """
         if not self.ip_address:
             raise ConnectionError(f"Device {self.device_id} has no IP address")
 
         url = f"http://{self.ip_address}/api/command"
-        body = json.dumps({"command": command, "payload": payload or {}}).encode()
-        req = urllib.request.Request(url, data=body, headers={"Content-Type": "application/json"})
+        body = orjson.dumps({"command": command, "payload": payload or {}})
+        if session is None:
+            session = self.http_session
         try:
-            with urllib.request.urlopen(req, timeout=10) as resp:
-                return json.loads(resp.read())
+            if session is None or session.closed:
+                # One-off session; pass a shared one to keep connections alive
+                async with aiohttp.ClientSession() as own_session:
+                    return await self._post_command(own_session, url, body)
+            return await self._post_command(session, url, body)
         except Exception as exc:
             logger.error("Command '%s' failed on %s: %s", command, self.device_id, exc)
             raise
 
+    @staticmethod
+    async def _post_command(session: Any, url: str, body: bytes) -> Dict[str, Any]:
+        async with session.post(
+            url,
+            data=body,
+            headers={"Content-Type": "application/json"},
+            timeout=aiohttp.ClientTimeout(total=10),
+        ) as resp:
+            resp.raise_for_status()
+            return await resp.json(content_type=None)
+
     # ------------------------------------------------------------------
     # Frequency / modulation
     # ------------------------------------------------------------------
@@ -142,12 +188,12 @@ class ESP32Device:
     # Firmware
     # ------------------------------------------------------------------
 
-    async def flash_firmware(self, firmware_url: str) -> bool:
+    async def flash_firmware(self, firmware_url: str, session: Optional[Any] = None) -> bool:
         """Trigger an OTA firmware update on the device."""
         logger.info("OTA update initiated on %s from %s", self.device_id, firmware_url)
         self.status = DeviceStatus.UPDATING
         try:
-            resp = await self.send_command("ota_update", {"url": firmware_url})
+            resp = await self.send_command("ota_update", {"url": firmware_url}, session=session)
             if resp.get("status") == "ok":
                 self.firmware_version = resp.get("new_version", self.firmware_version)
                 self.status = DeviceStatus.ONLINE
@@ -166,7 +212,7 @@ class ESP32Device:
     def update_telemetry(self, data: Dict[str, Any]) -> None:
         """Merge incoming telemetry data from the device."""
         self.telemetry.update(data)
-        self.last_seen = datetime.now(timezone.utc).isoformat()
+        self.last_seen = now_iso()
         if "rssi" in data:
             self.rssi = data["rssi"]
         if "frequency_hz" in data:
@@ -175,13 +221,36 @@ class ESP32Device:
     def has_capability(self, cap: DeviceCapability) -> bool:
         return cap in self.capabilities
 
+    def to_json_bytes(self) -> bytes:
+        """
+        Return ``to_dict()`` encoded as JSON, re-encoding only after a change.
+
+        Attribute writes and ``update_telemetry`` invalidate the cache;
+        in-place edits of ``telemetry`` / ``capabilities`` must go through
+        those paths to be picked up.
+        """
+        if self._json is None:
+            self._json = orjson.dumps(
+                self.to_dict(), default=str, option=orjson.OPT_NON_STR_KEYS
+            )
+        return self._json
+
+    def status_row(self) -> Dict[str, Any]:
+        """Summary used by ``Orchestrator.get_status`` (a new dict per call)."""
+        return {
+            "device_id": self.device_id,
+            "name": self.name,
+            "status": self.status_str,
+            "ip_address": self.ip_address,
+        }
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "device_id": self.device_id,
             "name": self.name,
             "ip_address": self.ip_address,
             "mac_address": self.mac_address,
-            "status": self.status.value,
+            "status": self.status_str,
             "firmware_version": self.firmware_version,
             "current_frequency_hz": self.current_frequency,
             "rssi": self.rssi,
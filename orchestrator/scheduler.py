@@ -3,11 +3,12 @@ Task scheduler — priority-aware async task queue for the orchestrator.
 """
 
 import asyncio
-import heapq
+import itertools
 import logging
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Any, Callable, Coroutine, Dict, List, Optional
+from typing import Any, Coroutine, Dict, List, Optional, Tuple
+
+from .clock import now_iso
 
 logger = logging.getLogger(__name__)
 
@@ -25,14 +26,22 @@ class TaskScheduler:
     """
     Priority-based async task scheduler.
 
-    Lower priority value = higher urgency (processed first).
+    Lower priority value = higher urgency (processed first).  The queue is
+    consumed only by ``max_concurrent`` persistent worker tasks, started by
+    the first ``schedule`` (or ``join``) inside a running loop; ``schedule``
+    hands back a future for each task's result.
     """
 
     def __init__(self, max_concurrent: int = 10):
-        self._queue: List[ScheduledTask] = []
+        # Entries are (priority, seq, task): ties resolve FIFO on the int
+        # counter, so the heap never falls back to comparing ScheduledTask
+        self._queue: "asyncio.PriorityQueue[Tuple[int, int, ScheduledTask]]" = (
+            asyncio.PriorityQueue()
+        )
+        self._seq = itertools.count()
         self._max_concurrent = max_concurrent
-        self._running_tasks: Dict[str, asyncio.Task] = {}
-        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._workers: List[asyncio.Task] = []
+        self._futures: Dict[str, asyncio.Future] = {}
 
     def schedule(
         self,
@@ -40,39 +49,91 @@ class TaskScheduler:
         task_id: str,
         priority: int = 5,
         metadata: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        """Add a coroutine to the scheduler queue."""
+    ) -> Optional[asyncio.Future]:
+        """
+        Add a coroutine to the scheduler queue.
+
+        Inside a running loop this starts the workers if needed and returns a
+        future resolved with the task's result; otherwise returns None and
+        the task waits until the workers are started.
+        """
         task = ScheduledTask(
             priority=priority,
             task_id=task_id,
             coro=coro,
-            scheduled_at=datetime.now(timezone.utc).isoformat(),
+            scheduled_at=now_iso(),
             metadata=metadata or {},
         )
-        heapq.heappush(self._queue, task)
+        fut: Optional[asyncio.Future] = None
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not None:
+            fut = self._futures[task_id] = loop.create_future()
+            self._start_workers(loop)
+        self._queue.put_nowait((priority, next(self._seq), task))
         logger.debug("Scheduled task %s (priority=%d)", task_id, priority)
+        return fut
+
+    async def join(self) -> None:
+        """Start the workers if needed and wait until the queue is drained."""
+        self._start_workers(asyncio.get_running_loop())
+        await self._queue.join()
 
-    async def run_next(self) -> Optional[Any]:
-        """Pop and execute the highest-priority queued task."""
-        if not self._queue:
-            return None
-        task = heapq.heappop(self._queue)
-        async with self._semaphore:
-            return await task.coro
-
-    async def run_all(self) -> List[Any]:
-        """Drain the queue, executing tasks concurrently up to max_concurrent."""
-        results = []
-        while self._queue:
-            batch = []
-            while self._queue and len(batch) < self._max_concurrent:
-                batch.append(heapq.heappop(self._queue).coro)
-            batch_results = await asyncio.gather(*batch, return_exceptions=True)
-            results.extend(batch_results)
-        return results
+    async def stop(self) -> None:
+        """Cancel the workers and every task that has not finished yet."""
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self.clear()
 
     def pending_count(self) -> int:
-        return len(self._queue)
+        return self._queue.qsize()
 
     def clear(self) -> None:
-        self._queue.clear()
+        while not self._queue.empty():
+            _, _, task = self._queue.get_nowait()
+            task.coro.close()
+            fut = self._futures.pop(task.task_id, None)
+            if fut is not None and not fut.done():
+                fut.cancel()
+            self._queue.task_done()
+
+    # ------------------------------------------------------------------
+    # Workers
+    # ------------------------------------------------------------------
+
+    def _start_workers(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._workers:
+            return
+        self._workers = [
+            loop.create_task(self._worker()) for _ in range(self._max_concurrent)
+        ]
+
+    async def _worker(self) -> None:
+        while True:
+            _, _, task = await self._queue.get()
+            try:
+                await self._run(task)
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.debug("Scheduled task %s failed: %s", task.task_id, exc)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, task: ScheduledTask) -> Any:
+        """Run one task and resolve its future."""
+        fut = self._futures.pop(task.task_id, None)
+        try:
+            result = await task.coro
+        except BaseException as exc:
+            if fut is not None and not fut.done():
+                if isinstance(exc, asyncio.CancelledError):
+                    fut.cancel()
+                else:
+                    fut.set_exception(exc)
+            raise
+        if fut is not None and not fut.done():
+            fut.set_result(result)
+        return result
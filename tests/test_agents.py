@@ -146,6 +146,29 @@ async def test_firmware_flash_no_device():
     await agent.stop()
 
 
+@pytest.mark.asyncio
+async def test_firmware_flash_build_served_and_closed_on_stop():
+    from orchestrator.device import ESP32Device
+
+    class _Device(ESP32Device):
+        async def flash_firmware(self, firmware_url, session=None):
+            async with session.get(firmware_url) as resp:
+                self.fetched = await resp.read()
+            return resp.status == 200
+
+    agent = FirmwareAgent({"ota_host": "127.0.0.1", "ota_port": 0})
+    await agent.start()
+    build = await agent.execute("build", {"features": ["wifi"], "version": "ota-test"}, None)
+    device = _Device("fw-1", "Flash")
+    result = await agent.execute("flash", {"build_id": build["build_id"]}, device)
+    assert result["ok"] is True
+    assert result["firmware_url"].startswith("http://127.0.0.1:")
+    assert len(device.fetched) > 0
+    flasher = agent._flasher
+    await agent.stop()
+    assert agent._flasher is None and flasher._runner is None
+
+
 # ------------------------------------------------------------------
 # AIAgent
 # ------------------------------------------------------------------
@@ -3,9 +3,10 @@ Tests for cloud connectors and the telemetry monitor.
 """
 
 import asyncio
+import time
 import pytest
 
-from cloud.connector import CloudConnector, HTTPConnector
+from cloud.connector import BufferedCloudConnector, CloudConnector, HTTPConnector
 from logging_system.monitor import TelemetryMonitor, Alert
 
 
@@ -38,6 +39,123 @@ async def test_http_connector_pull_no_endpoint():
     assert result is None
 
 
+@pytest.mark.asyncio
+async def test_http_connector_batches_pushes():
+    c = HTTPConnector("http://localhost/telemetry",
+                      {"cloud_batch_size": 3, "cloud_batch_interval": 0.05})
+    sent = []
+
+    async def _post(body, extra_headers=None):
+        sent.append(body)
+        return True
+
+    c._post = _post
+    for i in range(4):
+        assert await c.push({"seq": i}) is True
+    assert sent == [b'[{"seq":0},{"seq":1},{"seq":2}]']
+    await asyncio.sleep(0.1)  # interval flush picks up the straggler
+    assert sent[-1] == b'[{"seq":3}]'
+
+
+@pytest.mark.asyncio
+async def test_http_connector_requeues_failed_batch():
+    c = HTTPConnector("http://localhost/telemetry",
+                      {"cloud_batch_size": 2, "cloud_buffer_max": 3})
+    sent = []
+    up = False
+
+    async def _post(body, extra_headers=None):
+        if up:
+            sent.append(body)
+        return up
+
+    c._post = _post
+    await c.push({"seq": 0})
+    assert await c.push({"seq": 1}) is False
+    assert await c.push({"seq": 2}) is False
+    assert await c.push({"seq": 3}) is False  # oldest dropped past cloud_buffer_max
+    up = True
+    assert await c.flush() is True
+    assert sent == [b'[{"seq":1},{"seq":2},{"seq":3}]']
+
+
+@pytest.mark.asyncio
+async def test_outbox_disables_http_batching(tmp_path):
+    c = CloudConnector.create("http", "http://127.0.0.1:1/telemetry", {
+        "cloud_batch_size": 5,
+        "cloud_outbox_path": str(tmp_path / "outbox.db"),
+    })
+    assert isinstance(c, BufferedCloudConnector)
+    assert await c.inner.push({"seq": 1}) is False  # sent now, not buffered
+    await c.aclose()
+
+
+@pytest.mark.asyncio
+async def test_buffered_connector_retries_from_outbox(tmp_path):
+    class _Flaky(CloudConnector):
+        def __init__(self):
+            super().__init__("", {})
+            self.up = False
+            self.received = []
+
+        async def push(self, payload):
+            if self.up:
+                self.received.append(payload)
+            return self.up
+
+        async def pull(self, topic=None):
+            return None
+
+    inner = _Flaky()
+    c = BufferedCloudConnector(inner, str(tmp_path / "outbox.db"), retry_interval=0.01)
+    assert await c.push({"seq": 1}) is True
+    assert await c.push({"seq": 2}) is True
+    await asyncio.sleep(0.02)
+    assert c.pending() == 2 and inner.received == []
+
+    inner.up = True
+    await asyncio.sleep(0.05)
+    assert inner.received == [{"seq": 1}, {"seq": 2}]
+    assert c.pending() == 0
+    await c.aclose()
+
+
+@pytest.mark.asyncio
+async def test_buffered_connectors_share_outbox_file(tmp_path):
+    class _Recorder(CloudConnector):
+        def __init__(self, endpoint):
+            super().__init__(endpoint, {})
+            self.up = False
+            self.received = []
+
+        async def push(self, payload):
+            if self.up:
+                self.received.append(payload)
+            return self.up
+
+        async def pull(self, topic=None):
+            return None
+
+    path = str(tmp_path / "outbox.db")
+    http, aws = _Recorder("http://a"), _Recorder("aws://b")
+    c_http = BufferedCloudConnector(http, path, max_rows=2, retry_interval=0.01,
+                                    target="http:http://a")
+    c_aws = BufferedCloudConnector(aws, path, retry_interval=0.01, target="aws:aws://b")
+    for seq in range(3):
+        await c_http.push({"for": "http", "seq": seq})
+    await c_aws.push({"for": "aws"})
+    assert c_http.pending() == 2  # trimmed to its own max_rows only
+    assert c_aws.pending() == 1
+
+    http.up = aws.up = True
+    await asyncio.sleep(0.05)
+    assert http.received == [{"for": "http", "seq": 1}, {"for": "http", "seq": 2}]
+    assert aws.received == [{"for": "aws"}]
+    assert c_http.pending() == 0 and c_aws.pending() == 0
+    await c_http.aclose()
+    await c_aws.aclose()
+
+
 # ------------------------------------------------------------------
 # TelemetryMonitor
 # ------------------------------------------------------------------
@@ -71,6 +189,36 @@ def test_monitor_alert_callback():
     assert alerts[0].metric == "rssi"
 
 
+@pytest.mark.asyncio
+async def test_monitor_alert_callbacks_run_off_loop():
+    monitor = TelemetryMonitor(_MockOrchestrator())
+    received = []
+
+    def _slow(alert):
+        time.sleep(0.2)
+        received.append("sync")
+
+    async def _async(alert):
+        received.append("async")
+
+    monitor.on_alert(_slow)
+    monitor.on_alert(_async)
+    started = time.perf_counter()
+    monitor._raise_alert("dev-1", "rssi", -95, -90, "rssi below minimum")
+    assert time.perf_counter() - started < 0.1
+    await monitor.stop()  # waits for in-flight callbacks
+    assert sorted(received) == ["async", "sync"]
+
+
+def test_monitor_telemetry_history_limit():
+    monitor = TelemetryMonitor(_MockOrchestrator())
+    for i in range(5):
+        monitor._telemetry_history["dev-1"].append({"seq": i})
+    assert [t["seq"] for t in monitor.get_telemetry_history("dev-1", limit=2)] == [3, 4]
+    assert len(monitor.get_telemetry_history("dev-1")) == 5
+    assert monitor.get_telemetry_history("missing", limit=2) == []
+
+
 def test_monitor_get_alerts_empty():
     orch = _MockOrchestrator()
     monitor = TelemetryMonitor(orch)
@@ -94,3 +242,9 @@ def test_alert_to_dict():
     assert d["metric"] == "rssi"
     assert d["value"] == -95
     assert d["threshold"] == -90
+
+
+def test_alert_to_dict_not_shared():
+    a = Alert("dev-1", "rssi", -95, -90, "test alert")
+    a.to_dict()["value"] = 0
+    assert a.to_dict()["value"] == -95
@@ -1,5 +1,6 @@
 """
-Tests for firmware builder, GPS parser, and AI frequency lock controller.
+Tests for firmware builder, GPS parser, WiFi subnet scan, AI frequency lock
+controller and automation engine.
 """
 
 import asyncio
@@ -8,6 +9,9 @@ from pathlib import Path
 
 from firmware.builder import FirmwareBuilder
 from comms.gps import GPSManager
+from comms.wifi import WiFiManager
+from firmware.flasher import OTAFlasher
+from ai.automation import AutomationEngine, AutomationPolicy
 from ai.frequency_lock import FrequencyLockController, PIDController
 
 
@@ -62,6 +66,49 @@ async def test_builder_build_idempotent():
     assert r1["build_id"] == r2["build_id"]
 
 
+@pytest.mark.asyncio
+async def test_ota_flasher_serves_published_binary(tmp_path):
+    import aiohttp
+
+    binary = tmp_path / "b1" / "firmware.bin"
+    binary.parent.mkdir()
+    binary.write_bytes(b"\xe9firmware")
+    flasher = OTAFlasher(host_ip="127.0.0.1", port=0)
+    url = await flasher._publish(binary)
+    try:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(url) as resp:
+                assert resp.status == 200
+                assert await resp.read() == b"\xe9firmware"
+            async with session.get(url + ".missing") as resp:
+                assert resp.status == 404
+    finally:
+        await flasher.close()
+    assert flasher._runner is None
+
+
+@pytest.mark.asyncio
+async def test_ota_flasher_start_failure_releases_runner(tmp_path, monkeypatch):
+    import socket
+    from aiohttp import web
+
+    cleaned = []
+    cleanup = web.AppRunner.cleanup
+
+    async def _cleanup(runner):
+        cleaned.append(runner)
+        await cleanup(runner)
+
+    monkeypatch.setattr(web.AppRunner, "cleanup", _cleanup)
+    with socket.socket() as busy:
+        busy.bind(("0.0.0.0", 0))
+        busy.listen()
+        flasher = OTAFlasher(host_ip="127.0.0.1", port=busy.getsockname()[1])
+        with pytest.raises(OSError):
+            await flasher._publish(tmp_path / "firmware.bin")
+    assert len(cleaned) == 1 and flasher._runner is None
+
+
 # ------------------------------------------------------------------
 # GPS parser
 # ------------------------------------------------------------------
@@ -90,6 +137,15 @@ def test_gps_parse_invalid():
     assert gps.parse_nmea("") is None
 
 
+def test_gps_parse_south_west():
+    gps = GPSManager()
+    sentence = "$GNGGA,123519,4807.038,S,01131.000,W,1,08,0.9,-5.4,M,46.9,M,,*47"
+    fix = gps.parse_nmea(sentence)
+    assert fix is not None
+    assert fix.latitude < 0 and fix.longitude < 0
+    assert fix.altitude_m == pytest.approx(-5.4)
+
+
 def test_gps_inject_nmea():
     gps = GPSManager()
     sentence = "$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,46.9,M,,*47"
@@ -103,6 +159,34 @@ def test_gps_no_fix_initially():
     assert gps.get_fix() is None
 
 
+# ------------------------------------------------------------------
+# WiFi subnet scan
+# ------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_wifi_scan_subnet_open_refused_timeout(monkeypatch):
+    server = await asyncio.start_server(lambda r, w: w.close(), "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    real_open = asyncio.open_connection
+
+    async def _open_connection(host, port_, **kwargs):
+        if host == "127.0.0.2":  # silently dropped: the probe times out
+            await asyncio.sleep(10)
+        return await real_open(host, port_, **kwargs)
+
+    monkeypatch.setattr(asyncio, "open_connection", _open_connection)
+    try:
+        # .1 is listening; .3-.6 refuse (the server is bound to .1 only)
+        hosts = await WiFiManager().scan_subnet(
+            "127.0.0.0/29", port=port, timeout=0.1, concurrency=2
+        )
+    finally:
+        server.close()
+        await server.wait_closed()
+    assert hosts == ["127.0.0.1", "127.0.0.3", "127.0.0.4", "127.0.0.5", "127.0.0.6"]
+    assert await WiFiManager().scan_subnet("not-a-subnet") == []
+
+
 # ------------------------------------------------------------------
 # PIDController
 # ------------------------------------------------------------------
@@ -151,3 +235,62 @@ def test_freq_lock_clamped():
     )
     correction = ctrl.compute_correction(-10.0)
     assert abs(correction) <= 1e6
+
+
+def test_freq_lock_set_target_resets_integral():
+    ctrl = FrequencyLockController(target_rssi=-50.0, kp=0.0, ki=1.0, kd=0.0)
+    ctrl.compute_correction(-70.0)
+    assert ctrl._pid._integral != 0.0
+    ctrl.set_target(-50.0)  # unchanged setpoint keeps the PID state
+    assert ctrl._pid._integral != 0.0
+    ctrl.target_rssi = -60.0
+    assert ctrl.target_rssi == -60.0
+    assert ctrl._pid._integral == 0.0
+
+
+# ------------------------------------------------------------------
+# AutomationEngine
+# ------------------------------------------------------------------
+
+class _AutomationOrchestrator:
+    """Orchestrator stub with one AI agent that accepts every task."""
+
+    class _Agent:
+        agent_id = "ai-1"
+
+    def get_agents_by_type(self, agent_type):
+        return [self._Agent()]
+
+    async def dispatch_task(self, agent_id, task, params=None, device_id=None):
+        return "task-1"
+
+
+def test_automation_policy_list_read_only():
+    engine = AutomationEngine(_AutomationOrchestrator())
+    policies = engine.list_policies()
+    assert engine.list_policies() is policies
+    with pytest.raises(TypeError):
+        policies[0]["enabled"] = False
+    other = AutomationEngine(_AutomationOrchestrator())
+    other.enable_policy("anomaly_scan", False)
+    assert {p["name"]: p["enabled"] for p in engine.list_policies()}["anomaly_scan"]
+
+
+@pytest.mark.asyncio
+async def test_automation_policy_list_invalidated():
+    engine = AutomationEngine(_AutomationOrchestrator())
+    names = lambda: [p["name"] for p in engine.list_policies()]
+
+    engine.add_policy(AutomationPolicy("extra", "recommend_config"))
+    assert names()[-1] == "extra"
+    assert engine.remove_policy("extra")
+    assert "extra" not in names()
+
+    engine.enable_policy("fleet_optimise", False)
+    assert not {p["name"]: p["enabled"] for p in engine.list_policies()}["fleet_optimise"]
+
+    before = engine.list_policies()
+    await engine._run_policy(engine._policies[0])
+    fired = engine.list_policies()[0]
+    assert fired is not before[0]
+    assert fired["run_count"] == 1 and fired["last_run"] is not None
@@ -0,0 +1,57 @@
+"""
+Tests for the logging setup.
+"""
+
+import json
+import logging
+import random
+from datetime import datetime, timezone
+
+import pytest
+
+from logging_system import logger as log_setup
+
+
+@pytest.fixture
+def restore_root_logger():
+    root = logging.getLogger()
+    level, handlers = root.level, list(root.handlers)
+    yield
+    log_setup._stop_listener()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+    log_setup._queue_handler = None
+
+
+def test_json_timestamp_matches_isoformat():
+    fmt = log_setup.JSONFormatter()
+    stamps = [1_700_000_000.0, 1_700_000_000.5, 1_700_000_000.9999997, 1_700_000_001.000001]
+    rng = random.Random(7)
+    stamps += [1_700_000_000 + rng.random() * 86_400 for _ in range(2000)]
+    for t in stamps:
+        assert fmt._timestamp(t) == datetime.fromtimestamp(t, tz=timezone.utc).isoformat()
+
+
+def test_json_log_keeps_exception_field(tmp_path, restore_root_logger):
+    log_setup.setup_logging(level="INFO", log_dir=str(tmp_path), json_format=True)
+    log = logging.getLogger("test.logging")
+    try:
+        raise ValueError("bad value")
+    except ValueError:
+        log.exception("boom %s", 1)
+    log_setup._stop_listener()  # drains the queue and flushes the file
+
+    lines = (tmp_path / "orchestrator.log").read_text(encoding="utf-8").splitlines()
+    doc = json.loads(lines[-1])
+    assert doc["message"] == "boom 1"
+    assert doc["level"] == "ERROR"
+    assert "ValueError: bad value" in doc["exception"]
+
+
+def test_setup_logging_again_closes_old_log_file(tmp_path, restore_root_logger):
+    log_setup.setup_logging(log_dir=str(tmp_path / "first"))
+    old_file = log_setup._listener.handlers[1].target
+    logging.getLogger("test.logging").warning("to first")
+    log_setup.setup_logging(log_dir=str(tmp_path / "second"))
+    assert old_file.stream is None  # closed, not leaked
+    assert "to first" in (tmp_path / "first" / "orchestrator.log").read_text(encoding="utf-8")
@@ -64,6 +64,36 @@ def test_unregister_nonexistent_device(orchestrator):
     assert not orchestrator.unregister_device("nonexistent")
 
 
+def test_devices_view_cached_until_change(orchestrator, device):
+    empty = orchestrator.devices_view()
+    assert empty == ()
+    assert orchestrator.devices_view() is empty
+    version = orchestrator.devices_version
+
+    orchestrator.register_device(device)
+    view = orchestrator.devices_view()
+    assert view == (device,)
+    assert orchestrator.devices_version == version + 1
+    assert orchestrator.devices_view() is view
+
+    orchestrator.unregister_device(device.device_id)
+    assert orchestrator.devices_view() == ()
+    assert orchestrator.devices_version == version + 2
+
+
+def test_device_json_cache_invalidated_on_change(orchestrator, device):
+    import json
+    orchestrator.register_device(device)
+    first = device.to_json_bytes()
+    assert device.to_json_bytes() is first
+    assert json.loads(orchestrator.devices_json()) == [device.to_dict()]
+
+    device.update_telemetry({"rssi": -42})
+    assert json.loads(device.to_json_bytes())["rssi"] == -42
+    device.status = DeviceStatus.OFFLINE
+    assert json.loads(device.to_json_bytes())["status"] == "offline"
+
+
 def test_get_online_devices(orchestrator, device):
     orchestrator.register_device(device)
     online = orchestrator.get_online_devices()
@@ -73,6 +103,59 @@ def test_get_online_devices(orchestrator, device):
     assert device not in orchestrator.get_online_devices()
 
 
+@pytest.mark.asyncio
+async def test_bulk_get_telemetry(orchestrator):
+    class _FakeDevice(ESP32Device):
+        async def send_command(self, command, payload=None, session=None):
+            if self.device_id == "bad":
+                raise ConnectionError("unreachable")
+            return {"rssi": -50, "id": self.device_id}
+
+    for dev_id in ("a", "b", "bad"):
+        orchestrator.register_device(_FakeDevice(dev_id, dev_id))
+    results = await orchestrator.bulk_get_telemetry(["a", "b", "bad", "missing"])
+    assert results == {"a": {"rssi": -50, "id": "a"}, "b": {"rssi": -50, "id": "b"}}
+
+
+@pytest.mark.asyncio
+async def test_device_ping_tcp_probe():
+    server = await asyncio.start_server(lambda r, w: w.close(), "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    dev = ESP32Device("p-1", "Probe", ip_address="127.0.0.1", config={"health_port": port})
+    assert await dev.ping() is True
+    assert dev.status == DeviceStatus.ONLINE and dev.last_seen is not None
+    server.close()
+    await server.wait_closed()
+
+    no_ip = ESP32Device("p-2", "NoIP")
+    assert await no_ip.ping() is False
+    assert no_ip.status == DeviceStatus.OFFLINE
+
+
+@pytest.mark.asyncio
+async def test_device_send_command_does_not_block_loop():
+    from aiohttp import web
+
+    async def _command(request):
+        body = await request.json()
+        return web.json_response({"status": "ok", "command": body["command"]})
+
+    app = web.Application()
+    app.router.add_post("/api/command", _command)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    try:
+        dev = ESP32Device("c-1", "Cmd", ip_address=f"127.0.0.1:{port}")
+        # The device's HTTP server runs on this same loop
+        resp = await asyncio.wait_for(dev.send_command("get_rssi"), timeout=5)
+        assert resp == {"status": "ok", "command": "get_rssi"}
+    finally:
+        await runner.cleanup()
+
+
 # ------------------------------------------------------------------
 # Agent registration
 # ------------------------------------------------------------------
@@ -101,6 +184,19 @@ def test_get_agents_by_type(orchestrator):
     assert len(orchestrator.get_agents_by_type("modulation_agent")) == 1
 
 
+def test_unregister_agent(orchestrator):
+    a1 = FrequencyAgent()
+    a2 = FrequencyAgent()
+    orchestrator.register_agent(a1)
+    orchestrator.register_agent(a2)
+    assert orchestrator.unregister_agent(a1.agent_id)
+    assert orchestrator.get_agent(a1.agent_id) is None
+    assert orchestrator.get_agents_by_type("frequency_agent") == [a2]
+    assert not orchestrator.unregister_agent(a1.agent_id)
+    assert orchestrator.unregister_agent(a2.agent_id)
+    assert orchestrator.get_agents_by_type("frequency_agent") == []
+
+
 # ------------------------------------------------------------------
 # Event system
 # ------------------------------------------------------------------
@@ -113,6 +209,18 @@ def test_event_listener(orchestrator, device):
     assert received[0]["device_id"] == "test-001"
 
 
+def test_event_listener_error_isolated(orchestrator, device):
+    received = []
+
+    def _broken(data):
+        raise RuntimeError("listener bug")
+
+    orchestrator.on("device_registered", _broken)
+    orchestrator.on("device_registered", lambda d: received.append(d))
+    orchestrator.register_device(device)  # must not raise
+    assert len(received) == 1
+
+
 # ------------------------------------------------------------------
 # Status
 # ------------------------------------------------------------------
@@ -129,6 +237,17 @@ def test_get_status_structure(orchestrator, device, all_agents):
     assert len(status["agents"]) == len(all_agents)
 
 
+def test_get_status_device_rows_not_shared(orchestrator, device):
+    orchestrator.register_device(device)
+    row = orchestrator.get_status()["devices"][0]
+    row["status"] = "tampered"
+    assert orchestrator.get_status()["devices"][0]["status"] == "online"
+    device.status = DeviceStatus.OFFLINE
+    row = orchestrator.get_status()["devices"][0]
+    assert row == {"device_id": "test-001", "name": "TestDevice",
+                   "status": "offline", "ip_address": "127.0.0.1"}
+
+
 # ------------------------------------------------------------------
 # Async lifecycle
 # ------------------------------------------------------------------
@@ -143,6 +262,19 @@ async def test_start_stop(orchestrator, all_agents):
     assert not orchestrator._running
 
 
+@pytest.mark.asyncio
+async def test_devices_share_pooled_session(orchestrator, device):
+    orchestrator.register_device(device)
+    await orchestrator.start()
+    late = ESP32Device("test-002", "Late", ip_address="127.0.0.2")
+    orchestrator.register_device(late)
+    session = device.http_session
+    assert session is not None and late.http_session is session
+    await orchestrator.stop()
+    assert session.closed
+    assert device.http_session is None and late.http_session is None
+
+
 # ------------------------------------------------------------------
 # Task dispatch (uses frequency agent with no real device)
 # ------------------------------------------------------------------
@@ -161,9 +293,274 @@ async def test_dispatch_task_no_device(orchestrator):
     await orchestrator.stop()
 
 
+@pytest.mark.asyncio
+async def test_task_results_bounded_lru():
+    orch = Orchestrator({"health_check_interval": 999, "max_task_results": 2})
+    agent = FrequencyAgent()
+    orch.register_agent(agent)
+    first = await orch.dispatch_task(agent.agent_id, "get_frequency")
+    second = await orch.dispatch_task(agent.agent_id, "get_frequency")
+    assert orch.get_task_result(first) is not None  # refresh: second is now oldest
+    third = await orch.dispatch_task(agent.agent_id, "get_frequency")
+    assert orch.get_task_result(second) is None
+    assert orch.get_task_result(first) is not None
+    assert orch.get_task_result(third) is not None
+
+
 @pytest.mark.asyncio
 async def test_dispatch_task_unknown_agent(orchestrator):
     await orchestrator.start()
     with pytest.raises(ValueError):
         await orchestrator.dispatch_task("nonexistent", "scan")
     await orchestrator.stop()
+
+
+@pytest.mark.asyncio
+async def test_broadcast_task(orchestrator):
+    agents = [FrequencyAgent(), FrequencyAgent()]
+    for agent in agents:
+        orchestrator.register_agent(agent)
+    task_ids = await orchestrator.broadcast_task("frequency_agent", "get_frequency")
+    assert len(task_ids) == 2
+    assert {orchestrator.get_task_result(t)["agent_id"] for t in task_ids} == {
+        a.agent_id for a in agents
+    }
+    assert await orchestrator.broadcast_task("missing", "get_frequency") == []
+
+
+@pytest.mark.asyncio
+async def test_broadcast_task_cancels_siblings_on_failure(orchestrator):
+    failing, slow = FrequencyAgent(), FrequencyAgent()
+    orchestrator.register_agent(failing)
+    orchestrator.register_agent(slow)
+    cancelled = []
+
+    async def _dispatch(agent_id, task, params=None, device_id=None):
+        if agent_id == failing.agent_id:
+            raise RuntimeError("dispatch failed")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(agent_id)
+            raise
+
+    orchestrator.dispatch_task = _dispatch
+    with pytest.raises(RuntimeError, match="dispatch failed"):
+        await orchestrator.broadcast_task("frequency_agent", "get_frequency")
+    assert cancelled == [slow.agent_id]  # already unwound when the error surfaces
+
+
+@pytest.mark.asyncio
+async def test_scheduler_workers_respect_priority():
+    from orchestrator import TaskScheduler
+    scheduler = TaskScheduler(max_concurrent=1)
+    order = []
+
+    async def _job(name):
+        order.append(name)
+        return name
+
+    futures = [
+        scheduler.schedule(_job("low"), "t1", priority=9),
+        scheduler.schedule(_job("high"), "t2", priority=1),
+        scheduler.schedule(_job("mid"), "t3", priority=5),
+    ]
+    assert await asyncio.gather(*futures) == ["low", "high", "mid"]
+    assert order == ["high", "mid", "low"]
+    assert scheduler.pending_count() == 0
+    await scheduler.stop()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_equal_priority_is_fifo():
+    from orchestrator import TaskScheduler
+    scheduler = TaskScheduler(max_concurrent=1)
+
+    order = []
+
+    async def _job(n):
+        order.append(n)
+        await asyncio.sleep(0)
+        return n
+
+    futures = [scheduler.schedule(_job(n), f"t{n}", priority=3) for n in range(5)]
+    await asyncio.sleep(0)  # the worker may already be holding the first task
+    futures.append(scheduler.schedule(_job(5), "t5", priority=3))
+    await scheduler.join()
+    assert order == [0, 1, 2, 3, 4, 5]
+    assert [f.result() for f in futures] == [0, 1, 2, 3, 4, 5]
+    await scheduler.stop()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_stop_cancels_queued_tasks():
+    from orchestrator import TaskScheduler
+    scheduler = TaskScheduler(max_concurrent=1)
+    started = asyncio.Event()
+
+    async def _slow():
+        started.set()
+        await asyncio.sleep(10)
+
+    running = scheduler.schedule(_slow(), "running")
+    queued_coro = _slow()
+    queued = scheduler.schedule(queued_coro, "queued")
+    await started.wait()
+    await scheduler.stop()
+    assert running.cancelled() and queued.cancelled()
+    assert queued_coro.cr_frame is None  # closed, never left un-awaited
+    assert scheduler.pending_count() == 0
+
+
+# ------------------------------------------------------------------
+# WebSocket status ticker
+# ------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_status_ticker_idle_without_clients(orchestrator):
+    from types import SimpleNamespace
+    from api import websocket as ws
+
+    calls = []
+    orchestrator.get_status = lambda: calls.append(1) or {}
+    app = SimpleNamespace(state=SimpleNamespace(orchestrator=orchestrator,
+                                                latest_status='{"stale":true}'))
+    ticker = asyncio.ensure_future(ws.status_ticker(app, interval=0.01))
+    await asyncio.sleep(0.05)
+    assert calls == [] and app.state.latest_status is None
+
+    client = ws._Client()
+    ws._connections["fake"] = client
+    try:
+        await asyncio.sleep(0.03)
+        assert calls and app.state.latest_status is not None
+        assert client.queue.get_nowait()[0] == "status"
+    finally:
+        ws._connections.pop("fake", None)
+        ticker.cancel()
+
+
+def test_ws_client_drops_oldest_when_full():
+    from api import websocket as ws
+
+    client = ws._Client()
+    for n in range(ws.CLIENT_QUEUE_SIZE + 2):
+        client.offer("event", str(n))
+    assert client.queue.qsize() == ws.CLIENT_QUEUE_SIZE
+    assert client.queue.get_nowait() == ("event", "2")
+
+
+@pytest.mark.asyncio
+async def test_ws_relay_sends_newest_status_only():
+    from api import websocket as ws
+
+    class _Socket:
+        def __init__(self):
+            self.sent = []
+
+        async def send_text(self, frame):
+            self.sent.append(frame)
+
+        async def send_bytes(self, frame):
+            self.sent.append(frame)
+
+    socket, client = _Socket(), ws._Client()
+    client.offer("status", "s1")
+    client.offer("event", "e1")
+    client.offer("status", "s2")
+    client.offer("reply", b"r1")
+    relay = asyncio.ensure_future(ws._relay(socket, client))
+    await asyncio.sleep(0)
+    relay.cancel()
+    assert socket.sent == ["e1", "s2", b"r1"]
+
+
+# ------------------------------------------------------------------
+# API: WebSocket formats and response cache
+# ------------------------------------------------------------------
+
+class _StubRedis:
+    """In-memory stand-in for the redis.asyncio client used by the routes."""
+
+    def __init__(self):
+        self.store = {}
+        self.deleted = []
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+
+    async def delete(self, *keys):
+        self.deleted.extend(keys)
+        for key in keys:
+            self.store.pop(key, None)
+
+
+@pytest.fixture
+def api_client(orchestrator):
+    from fastapi.testclient import TestClient
+    from api import create_app
+
+    return TestClient(create_app(orchestrator))
+
+
+def test_ws_msgpack_negotiation(api_client):
+    msgpack = pytest.importorskip("msgpack")
+
+    with api_client.websocket_connect("/ws/telemetry?format=msgpack") as socket:
+        assert msgpack.unpackb(socket.receive_bytes())["type"] == "status"
+        socket.send_text('{"command": "ping"}')
+        assert msgpack.unpackb(socket.receive_bytes()) == {"type": "pong"}
+
+    with api_client.websocket_connect("/ws/telemetry?format=xml") as socket:
+        assert socket.receive_json()["type"] == "status"
+
+
+def test_ws_msgpack_falls_back_to_json(api_client, monkeypatch):
+    import sys
+
+    monkeypatch.setitem(sys.modules, "msgpack", None)  # import raises ImportError
+    with api_client.websocket_connect("/ws/telemetry?format=msgpack") as socket:
+        assert socket.receive_json()["type"] == "status"
+        socket.send_text('{"command": "ping"}')
+        assert socket.receive_json() == {"type": "pong"}
+
+
+def test_api_status_served_from_memo(api_client, orchestrator):
+    calls = []
+    get_status = orchestrator.get_status
+    orchestrator.get_status = lambda: calls.append(1) or get_status()
+    first = api_client.get("/api/v1/status").json()
+    assert api_client.get("/api/v1/status").json() == first
+    assert len(calls) == 1
+
+
+def test_api_devices_served_from_redis(api_client):
+    pytest.importorskip("redis")
+    redis = api_client.app.state.redis = _StubRedis()
+    assert api_client.get("/api/v1/devices").json() == []
+    assert redis.store["api:v1:devices"] == b"[]"
+
+    redis.store["api:v1:devices"] = b'[{"device_id":"from-redis"}]'
+    assert api_client.get("/api/v1/devices").json() == [{"device_id": "from-redis"}]
+
+
+def test_api_cache_invalidated_on_post_and_delete(api_client):
+    pytest.importorskip("redis")
+    redis = api_client.app.state.redis = _StubRedis()
+    assert api_client.get("/api/v1/status").json()["devices"] == []
+    assert api_client.get("/api/v1/devices").json() == []
+
+    resp = api_client.post("/api/v1/devices", json={"device_id": "d-1", "name": "One"})
+    assert resp.status_code == 200
+    assert {"api:v1:status", "api:v1:devices"} <= set(redis.deleted)
+    assert [d["device_id"] for d in api_client.get("/api/v1/devices").json()] == ["d-1"]
+    assert len(api_client.get("/api/v1/status").json()["devices"]) == 1
+
+    redis.deleted.clear()
+    assert api_client.delete("/api/v1/devices/d-1").json() == {"ok": True}
+    assert {"api:v1:status", "api:v1:devices"} <= set(redis.deleted)
+    assert api_client.get("/api/v1/devices").json() == []
+    assert api_client.get("/api/v1/status").json()["devices"] == []